@@ -29,8 +29,193 @@ import appdaemon.plugins.hass.hassapi as hass
 import json
 import time
 import re
+from types import MappingProxyType
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+try:
+    import orjson  # Optional: much faster parsing of large registry/inventory files
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec  # Optional: schema-based registry parsing that skips unused fields
+except ImportError:
+    msgspec = None
+
+# Scene states that never indicate an activation
+IGNORED_SCENE_STATES = frozenset((None, "unavailable", "unknown"))
+
+# Hue V2 resource IDs are UUIDs (e.g. f0309f80-9480-4b12-a0c3-a026790d87bf)
+HUE_RESOURCE_ID_LENGTH = 36
+
+# HA brightness (0-255) -> percentage
+HA_BRIGHTNESS_TO_PCT = 100.0 / 255.0
+
+# Percentage -> HA brightness (0-255)
+PCT_TO_HA_BRIGHTNESS = 255.0 / 100.0
+
+# Validation failure kinds (bits of SceneValidator.last_validation_failures)
+FAILURE_ON_OFF = 1
+FAILURE_BRIGHTNESS = 2
+FAILURE_COLOR = 4
+FAILURE_COLOR_TEMP = 8
+FAILURE_NAMES = (
+    (FAILURE_ON_OFF, 'on_off'),
+    (FAILURE_BRIGHTNESS, 'brightness'),
+    (FAILURE_COLOR, 'color'),
+    (FAILURE_COLOR_TEMP, 'color_temp'),
+)
+
+# Scene action flattened once at inventory load (None = not set by the scene)
+ParsedAction = namedtuple('ParsedAction', 'rid on brightness xy_x xy_y mirek')
+
+# Characters that make a name pattern a real regex rather than a literal prefix
+REGEX_METACHARACTERS = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+# Exceptions raised for malformed JSON by whichever parser is in use
+JSON_DECODE_ERRORS = (json.JSONDecodeError,) + ((msgspec.DecodeError,) if msgspec else ())
+
+if msgspec is not None:
+    class _RegistryEntry(msgspec.Struct):
+        """Entity registry entry - only the fields needed for Hue ID mapping."""
+        entity_id: Any = None
+        unique_id: Any = None
+        platform: Any = None
+
+    class _RegistryData(msgspec.Struct):
+        entities: List[_RegistryEntry]
+
+    class _Registry(msgspec.Struct):
+        data: _RegistryData
+
+    _REGISTRY_DECODER = msgspec.json.Decoder(_Registry)
+
+    class _SceneCollection(msgspec.Struct):
+        items: List[Dict[str, Any]] = []
+
+    class _InventoryResources(msgspec.Struct):
+        scenes: _SceneCollection = msgspec.field(default_factory=_SceneCollection)
+
+    class _Inventory(msgspec.Struct):
+        """Bridge inventory - only bridge_info and scenes are used by the validator."""
+        bridge_info: Dict[str, Any] = {}
+        resources: _InventoryResources = msgspec.field(default_factory=_InventoryResources)
+
+    _INVENTORY_DECODER = msgspec.json.Decoder(_Inventory)
+
+
+def load_json_file(path: Path) -> Any:
+    """
+    Parse a JSON file, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    only need to catch the stdlib exception.
+
+    Args:
+        path: JSON file to read
+
+    Returns:
+        Parsed JSON document
+    """
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_inventory_file(path: Path) -> Dict[str, Any]:
+    """
+    Load the parts of a bridge inventory the validator uses.
+
+    Inventories also contain devices, lights, groups and sensors, which the
+    validator never reads. Only bridge_info and resources.scenes.items are
+    kept; with msgspec installed the other resources are skipped by the
+    parser instead of being built into Python objects at all.
+
+    Args:
+        path: Inventory JSON file
+
+    Returns:
+        Inventory dict with bridge_info and resources.scenes.items
+    """
+    if msgspec is not None:
+        inventory = _INVENTORY_DECODER.decode(path.read_bytes())
+        bridge_info = inventory.bridge_info
+        scenes = inventory.resources.scenes.items
+    else:
+        inventory = load_json_file(path)
+        bridge_info = inventory.get('bridge_info', {})
+        scenes = inventory.get('resources', {}).get('scenes', {}).get('items', [])
+
+    return {'bridge_info': bridge_info, 'resources': {'scenes': {'items': scenes}}}
+
+
+def parse_scene_actions(actions: List[Dict[str, Any]]) -> List[ParsedAction]:
+    """
+    Flatten inventory scene actions into ParsedAction tuples.
+
+    Validation and Level 3 control read the same few nested fields for every
+    light on every run; resolving them once here replaces the chained
+    dict.get() calls with attribute access. Actions without a target rid
+    are dropped (they were skipped by every consumer anyway).
+
+    Args:
+        actions: Scene actions from inventory (non-legacy format)
+
+    Returns:
+        List of ParsedAction
+    """
+    parsed = []
+    for action in actions:
+        rid = (action.get('target') or {}).get('rid')
+        if not rid:
+            continue
+
+        expected = action.get('action') or {}
+        xy = (expected.get('color') or {}).get('xy')
+        parsed.append(ParsedAction(
+            rid=rid,
+            on=(expected.get('on') or {}).get('on', False),
+            brightness=(expected.get('dimming') or {}).get('brightness'),
+            xy_x=xy['x'] if xy else None,
+            xy_y=xy['y'] if xy else None,
+            mirek=(expected.get('color_temperature') or {}).get('mirek'),
+        ))
+    return parsed
+
+
+def load_registry_entries(path: Path) -> Optional[List[Tuple[Any, Any, Any]]]:
+    """
+    Read (entity_id, unique_id, platform) for every entity registry entry.
+
+    With msgspec installed the registry is decoded against a three-field
+    schema, so all other keys (options, capabilities, ...) are skipped by
+    the parser instead of being built into Python dicts.
+
+    Args:
+        path: Path to core.entity_registry
+
+    Returns:
+        List of (entity_id, unique_id, platform) tuples, or None if the
+        expected data.entities structure is missing
+    """
+    if msgspec is not None:
+        try:
+            registry = _REGISTRY_DECODER.decode(path.read_bytes())
+        except msgspec.ValidationError:
+            return None
+        return [(entry.entity_id, entry.unique_id, entry.platform)
+                for entry in registry.data.entities]
+
+    registry = load_json_file(path)
+    if 'data' not in registry or 'entities' not in registry.get('data', {}):
+        return None
+
+    return [(entry.get('entity_id'), entry.get('unique_id'), entry.get('platform'))
+            for entry in registry['data']['entities']]
 
 
 class SceneValidator(hass.Hass):
@@ -71,22 +256,33 @@ class SceneValidator(hass.Hass):
 
         # Scene filtering
         filter_config = self.args.get('scene_filter', {})
-        self.include_labels = filter_config.get('include_labels', [])
-        self.exclude_labels = filter_config.get('exclude_labels', [])
-        self.exclude_uids = filter_config.get('exclude_uids', [])
+        self.include_labels = frozenset(filter_config.get('include_labels', []))
+        self.exclude_labels = frozenset(filter_config.get('exclude_labels', []))
+        self.exclude_uids = frozenset(filter_config.get('exclude_uids', []))
         self.name_patterns = filter_config.get('name_patterns', [])
+        self._name_literal_prefixes, self._name_pattern_res = self._compile_name_patterns(self.name_patterns)
 
         # State tracking
-        self.inventories = []
-        self.hue_id_to_entity_id = {}  # Hue unique_id -> HA entity_id mapping cache
+        self.inventories = ()  # Parsed inventories, frozen per load
+        self.hue_id_to_entity_id = MappingProxyType({})  # Hue unique_id -> HA entity_id (read-only once loaded)
+        self.entity_id_to_hue_id = {}  # Reverse of hue_id_to_entity_id (first unique_id wins)
+        self._hue_id_suffix_index = {}  # Trailing resource ID of prefixed unique_ids -> HA entity_id
+        self._hue_lookup_cache = {}  # Memoized get_entity_id_from_hue_id() results (including misses)
+        self.scene_by_hue_id = {}  # Hue scene ID -> inventory scene data (all bridges)
+        self.has_legacy_inventory = False
+        self.normalized_bridge_ids = []  # Bridge IDs without colons, lowercased
+        self._is_hue_scene_cache = {}  # {scene_entity: bool}
+        self.monitored_scenes = set()  # Scene entity_ids routed to on_scene_state_changed
+        self._friendly_name_cache = {}  # {scene_entity: friendly name}
+        self._scene_listener_handle = None
         self.circuit_breaker_state = 'CLOSED'
         self.circuit_breaker_failures = 0
         self.circuit_breaker_successes = 0
         self.circuit_breaker_opened_at = None
-        self.validation_timestamps = []
-        self.scene_validation_timestamps = {}
+        self.validation_timestamps = deque()  # (timestamp, scene_entity) in insertion order
+        self.scene_validation_counts = Counter()  # {scene_entity: validations in current window}
         self.recent_validations = {}  # {scene_entity: timestamp}
-        self.last_validation_failures = []  # Track what failed: 'on_off', 'brightness', 'color', 'color_temp'
+        self.last_validation_failures = 0  # Bitmask of FAILURE_* kinds seen in the last validation
 
         # Tolerances for state comparison
         self.brightness_tolerance = self.args.get('brightness_tolerance', 5)  # ±5%
@@ -105,14 +301,18 @@ class SceneValidator(hass.Hass):
         try:
             self.load_entity_registry_mapping()
         except Exception as e:  # noqa: BLE001
-            self.error(f"Critical error loading entity registry: {e}")
-            import traceback
-            self.error(f"Traceback: {traceback.format_exc()}")
+            self.error(f"Critical error loading entity registry: {e}", exc_info=True)
 
         # Listen for scene activations from ANY source (HA, Hue app, switches)
         # Monitor state changes instead of call_service events
         self.setup_scene_listeners()
 
+        # Expire stale debounce/rate-limit records off the hot path
+        self.run_every(self._sweep_recent_validations, "now+300", 300)
+
+        # Scene renames invalidate cached friendly names
+        self.listen_event(self._on_entity_registry_updated, "entity_registry_updated")
+
         self.log("Validator initialized successfully")
         self.log(f"Inventory directory: {self.inventory_dir}")
         self.log("Detection: Universal (HA, Hue app, switches)")
@@ -124,12 +324,60 @@ class SceneValidator(hass.Hass):
         self.log(f"Circuit breaker: {self.cb_failure_threshold} failures / {self.cb_timeout}s timeout")
 
         if self.include_labels:
-            self.log(f"Include labels: {self.include_labels}")
+            self.log(f"Include labels: {sorted(self.include_labels)}")
         if self.exclude_labels:
-            self.log(f"Exclude labels: {self.exclude_labels}")
+            self.log(f"Exclude labels: {sorted(self.exclude_labels)}")
         if self.name_patterns:
             self.log(f"Name patterns: {self.name_patterns}")
 
+    def _compile_name_patterns(self, patterns: List[str]) -> Tuple[Tuple[str, ...], Tuple[re.Pattern, ...]]:
+        """
+        Split name patterns into literal prefixes and precompiled regexes.
+
+        re.match() anchors at the start of the name, so a pattern without regex
+        metacharacters is just a prefix and can be checked with str.startswith().
+        The remaining patterns are compiled individually rather than joined into
+        one alternation, since global inline flags such as (?i) are only valid
+        at the start of a whole pattern. Invalid patterns are logged and skipped
+        so one typo in apps.yaml does not disable the remaining patterns.
+
+        Args:
+            patterns: Regex patterns from scene_filter.name_patterns
+
+        Returns:
+            Tuple of (literal prefixes, compiled regexes for the remaining patterns)
+        """
+        literal_prefixes = tuple(p for p in patterns if not REGEX_METACHARACTERS.search(p))
+        compiled = []
+        for pattern in patterns:
+            if pattern in literal_prefixes:
+                continue
+            try:
+                compiled.append(re.compile(pattern))
+            except re.error as e:
+                self.error(f"Invalid name pattern '{pattern}': {e}")
+
+        return literal_prefixes, tuple(compiled)
+
+    def _only_color_temp_failed(self) -> bool:
+        """
+        Check if color temperature was the only kind of failure in the last validation.
+
+        Returns:
+            True if at least one light failed and every failure was color_temp
+        """
+        return self.last_validation_failures == FAILURE_COLOR_TEMP
+
+    def _describe_failures(self) -> List[str]:
+        """
+        Get the names of the failure kinds seen in the last validation.
+
+        Returns:
+            List of failure kind names (for logging)
+        """
+        mask = self.last_validation_failures
+        return [name for bit, name in FAILURE_NAMES if mask & bit]
+
     def _is_legacy_action_format(self, actions: List[Any]) -> bool:
         """
         Check if actions use legacy string format.
@@ -152,11 +400,28 @@ class SceneValidator(hass.Hass):
         for inventory in self.inventories:
             scenes = inventory.get('resources', {}).get('scenes', {}).get('items', [])
             for scene in scenes:
-                actions = scene.get('actions', [])
-                if self._is_legacy_action_format(actions):
+                if scene.get('_legacy_actions'):
                     return True
         return False
 
+    def _rebuild_scene_index(self):
+        """
+        Index scenes from all loaded inventories by Hue scene ID.
+
+        Called after inventories are (re)loaded so find_scene_in_inventory()
+        is a dict lookup instead of a scan over every inventory and scene.
+        Each scene's action format is classified, and its actions parsed, here once.
+        """
+        self.scene_by_hue_id = {}
+
+        for inventory in self.inventories:
+            for scene in inventory.get('resources', {}).get('scenes', {}).get('items', []):
+                scene['_legacy_actions'] = self._is_legacy_action_format(scene.get('actions', []))
+                if not scene['_legacy_actions']:
+                    scene['_parsed_actions'] = parse_scene_actions(scene.get('actions', []))
+                if scene.get('id'):
+                    self.scene_by_hue_id[scene['id']] = scene
+
     def load_inventories(self) -> bool:
         """
         Load Hue bridge inventories from filesystem.
@@ -176,17 +441,28 @@ class SceneValidator(hass.Hass):
             self.error(f"No inventory files found in: {self.inventory_dir}")
             return False
 
-        for inventory_file in inventory_files:
-            try:
-                with open(inventory_file) as f:
-                    inventory = json.load(f)
-                    self.inventories.append(inventory)
-                    # Handle nested bridge_info structure (bridge_info.config.name)
-                    bridge_config = inventory.get('bridge_info', {}).get('config', {})
-                    bridge_name = bridge_config.get('name') or inventory.get('bridge_info', {}).get('name', 'Unknown')
-                    self.log(f"Loaded inventory: {bridge_name}")
-            except (json.JSONDecodeError, IOError) as e:
-                self.error(f"Failed to load {inventory_file.name}: {e}")
+        # Read/parse files concurrently; results are consumed in file order
+        # so self.inventories stays deterministic
+        with ThreadPoolExecutor(max_workers=min(8, len(inventory_files))) as executor:
+            results = list(executor.map(self._load_one_inventory, inventory_files))
+
+        loaded = []
+        for inventory_file, inventory, error in results:
+            if error is not None:
+                self.error(f"Failed to load {inventory_file.name}: {error}")
+                continue
+
+            loaded.append(inventory)
+            # Handle nested bridge_info structure (bridge_info.config.name)
+            bridge_config = inventory.get('bridge_info', {}).get('config', {})
+            bridge_name = bridge_config.get('name') or inventory.get('bridge_info', {}).get('name', 'Unknown')
+            self.log(f"Loaded inventory: {bridge_name}")
+
+        # Parsed once per load and replaced wholesale on reload. The scene index
+        # built below points into these objects and annotates each scene dict
+        # (_legacy_actions, _parsed_actions); it is rebuilt on every load, so the
+        # annotations always describe the current inventories
+        self.inventories = tuple(loaded)
 
         if not self.inventories:
             self.error("No inventories loaded successfully")
@@ -194,8 +470,20 @@ class SceneValidator(hass.Hass):
 
         self.log(f"Loaded {len(self.inventories)} inventory file(s)")
 
+        self._rebuild_scene_index()
+
+        # Bridge IDs from Hue API typically have format: "XX:XX:XX:XX:XX:XX" (MAC address)
+        # HA unique_ids contain the normalized form without colons
+        self.normalized_bridge_ids = []
+        for inventory in self.inventories:
+            bridge_id = inventory.get('bridge_info', {}).get('bridge_id', '')
+            normalized_bridge_id = bridge_id.replace(':', '').lower()
+            if normalized_bridge_id:
+                self.normalized_bridge_ids.append(normalized_bridge_id)
+
         # Check for legacy inventory format (string-formatted actions)
-        if self._has_legacy_inventory_format():
+        self.has_legacy_inventory = self._has_legacy_inventory_format()
+        if self.has_legacy_inventory:
             self.log(
                 "WARNING: Legacy inventory format detected (string-formatted actions). "
                 "Level 1 validation will be limited. Please regenerate inventories with: "
@@ -205,6 +493,22 @@ class SceneValidator(hass.Hass):
 
         return True
 
+    @staticmethod
+    def _load_one_inventory(inventory_file: Path) -> Tuple[Path, Optional[Dict[str, Any]], Optional[Exception]]:
+        """
+        Load a single inventory file (runs in a worker thread).
+
+        Args:
+            inventory_file: Inventory JSON file
+
+        Returns:
+            Tuple of (file, inventory or None, error or None)
+        """
+        try:
+            return inventory_file, load_inventory_file(inventory_file), None
+        except (IOError, *JSON_DECODE_ERRORS) as e:
+            return inventory_file, None, e
+
     def load_entity_registry_mapping(self):
         """
         Load unique_id to entity_id mapping from entity registry.
@@ -233,38 +537,58 @@ class SceneValidator(hass.Hass):
             return
 
         try:
-            with open(registry_file) as f:
-                registry = json.load(f)
+            entries = load_registry_entries(registry_file)
 
             # Validate expected structure exists
-            if 'data' not in registry or 'entities' not in registry.get('data', {}):
+            if entries is None:
                 self.error("Entity registry structure has changed - expected 'data.entities' not found")
                 self.error("This may indicate a Home Assistant update that changed the internal storage format")
                 return
 
-            entities = registry.get('data', {}).get('entities', [])
-
             # Build mapping for Hue platform entities only
+            mapping = {}
             hue_count = 0
-            for entry in entities:
-                entity_id = entry.get('entity_id')
-                unique_id = entry.get('unique_id')
-                platform = entry.get('platform')
-
+            for entity_id, unique_id, platform in entries:
                 # Only map Hue platform entities
                 if platform == 'hue' and entity_id and unique_id:
-                    self.hue_id_to_entity_id[unique_id] = entity_id
+                    mapping[unique_id] = entity_id
                     hue_count += 1
 
-            self.log(f"Loaded entity registry mapping: {hue_count} Hue entities", level="DEBUG")
+            self._set_hue_mapping(mapping)
             self.log(f"Loaded entity registry mapping: {hue_count} Hue entities")
 
-        except (FileNotFoundError, json.JSONDecodeError, PermissionError) as e:
+        except (FileNotFoundError, PermissionError, *JSON_DECODE_ERRORS) as e:
             self.error(f"Failed to load entity registry: {e}")
             self.error("Entity ID mapping will not work - validation will fail")
         except Exception as e:  # noqa: BLE001
             self.error(f"Unexpected error loading entity registry: {e}")
 
+    def _set_hue_mapping(self, mapping: Dict[str, str]):
+        """
+        Publish a complete Hue unique_id -> HA entity_id mapping.
+
+        The mapping is frozen (read-only view) and the reverse map and suffix
+        index are derived from it once, so lookups never see a partial update.
+
+        Args:
+            mapping: Hue unique_id -> HA entity_id pairs from the entity registry
+        """
+        entity_id_to_hue_id = {}
+        suffix_index = {}
+        for unique_id, entity_id in mapping.items():
+            entity_id_to_hue_id.setdefault(entity_id, unique_id)
+
+            # Prefixed unique_ids (e.g. "<bridge>_<resource id>") - index the trailing resource ID
+            if len(unique_id) > HUE_RESOURCE_ID_LENGTH:
+                suffix_index.setdefault(unique_id[-HUE_RESOURCE_ID_LENGTH:], entity_id)
+
+        self.hue_id_to_entity_id = MappingProxyType(mapping)
+        self.entity_id_to_hue_id = entity_id_to_hue_id
+        self._hue_id_suffix_index = suffix_index
+
+        # Mapping replaced - memoized lookups may be stale
+        self._hue_lookup_cache = {}
+
     def setup_scene_listeners(self):
         """
         Set up state listeners for all scene entities.
@@ -275,11 +599,20 @@ class SceneValidator(hass.Hass):
         - Hue physical switches/dimmers
         - Hue third-party apps
 
-        Note: Monitors ALL scenes; filtering happens in should_validate_scene()
-        based on name_patterns, labels, etc.
+        Note: Only Hue scenes are monitored (checked once here via is_hue_scene());
+        further filtering happens in should_validate_scene() based on
+        name_patterns, labels, etc.
+
+        A single domain-level listener is registered for "scene" and events are
+        routed through _dispatch_scene_state(), so AppDaemon iterates one
+        callback per state change instead of one per scene.
         """
         scene_count = 0
 
+        # Scene set may have changed - drop cached Hue membership results
+        self._is_hue_scene_cache = {}
+        self.monitored_scenes = set()
+
         # Get all scene entities
         all_scenes = self.get_state("scene")
 
@@ -287,47 +620,91 @@ class SceneValidator(hass.Hass):
             self.error("No scene entities found in Home Assistant")
             return
 
-        for entity_id in all_scenes.keys():
-            # Monitor all scene entities - filtering happens later
-            # Listen to state changes (scene state IS the activation timestamp)
-            self.listen_state(self.on_scene_state_changed, entity_id)
+        skipped_count = 0
+        for entity_id, scene_state in all_scenes.items():
+            # Non-Hue scenes are never validated - keep them out of the dispatch set
+            # (attributes come from the bulk fetch above, no per-scene state call)
+            attributes = (scene_state or {}).get('attributes') or {}
+            if not self.is_hue_scene(entity_id, attributes):
+                skipped_count += 1
+                continue
+
+            self.monitored_scenes.add(entity_id)
             scene_count += 1
-            self.log(f"Monitoring: {entity_id}", level="DEBUG")
+
+        if skipped_count:
+            self.log(f"Ignoring {skipped_count} non-Hue scene(s)")
+
+        # Listen to state changes (scene state IS the activation timestamp)
+        if self._scene_listener_handle is not None:
+            self.cancel_listen_state(self._scene_listener_handle)
+        self._scene_listener_handle = self.listen_state(self._dispatch_scene_state, "scene")
 
         self.log(f"Monitoring {scene_count} scene(s) for activations")
 
-    def is_hue_scene(self, entity_id: str) -> bool:
+    def _dispatch_scene_state(self, entity, attribute, old, new, kwargs):
+        """
+        Route domain-level scene state changes to on_scene_state_changed().
+
+        Args:
+            entity: Scene entity_id
+            attribute: Attribute that changed (None for state)
+            old: Previous state
+            new: New state
+            kwargs: Additional parameters from AppDaemon
+        """
+        if entity not in self.monitored_scenes:
+            return
+
+        self.on_scene_state_changed(entity, attribute, old, new, kwargs)
+
+    def is_hue_scene(self, entity_id: str, attributes: Optional[Dict[str, Any]] = None) -> bool:
         """
         Check if scene entity belongs to Hue integration.
 
         Args:
             entity_id: HA entity_id (e.g., scene.wohnzimmer_standard)
+            attributes: Scene state attributes if already fetched (avoids another state API call)
+
+        Returns:
+            True if scene is from Hue integration, False otherwise
+        """
+        # Integration membership doesn't change at runtime - cache per entity
+        cached = self._is_hue_scene_cache.get(entity_id)
+        if cached is not None:
+            return cached
+
+        if attributes is None:
+            attributes = self._get_all_attributes(entity_id)
+
+        result = self._check_hue_scene(attributes)
+        self._is_hue_scene_cache[entity_id] = result
+        return result
+
+    def _check_hue_scene(self, attributes: Dict[str, Any]) -> bool:
+        """
+        Uncached Hue membership check used by is_hue_scene().
+
+        Args:
+            attributes: Scene state attributes
 
         Returns:
             True if scene is from Hue integration, False otherwise
         """
-        unique_id = self.get_state(entity_id, attribute="unique_id")
+        unique_id = attributes.get('unique_id')
 
         if unique_id:
             # Try unique_id approach (works for lights, sensors, etc.)
             # Check if unique_id contains any loaded Hue bridge ID
-            # Bridge IDs from Hue API typically have format: "XX:XX:XX:XX:XX:XX" (MAC address)
-            # HA unique_ids contain the normalized form without colons
-            for inventory in self.inventories:
-                bridge_id = inventory.get('bridge_info', {}).get('bridge_id', '')
-                if not bridge_id:
-                    continue
-
-                # Normalize bridge ID by removing colons (handles both formats)
-                normalized_bridge_id = bridge_id.replace(':', '').lower()
-                if normalized_bridge_id and normalized_bridge_id in unique_id.lower():
-                    return True
+            unique_id_lower = unique_id.lower()
+            if any(bridge_id in unique_id_lower for bridge_id in self.normalized_bridge_ids):
+                return True
 
         # Fallback for scenes: Check for Hue-specific attributes
         # Scene entities don't expose unique_id in state API, but have Hue-specific attributes
         # like group_name and group_type that non-Hue scenes don't have
-        group_name = self.get_state(entity_id, attribute="group_name")
-        group_type = self.get_state(entity_id, attribute="group_type")
+        group_name = attributes.get('group_name')
+        group_type = attributes.get('group_type')
 
         # If scene has both group_name and group_type, it's a Hue scene
         # (HA-created scenes don't have these attributes)
@@ -336,6 +713,50 @@ class SceneValidator(hass.Hass):
 
         return False
 
+    def _get_friendly_name(self, entity_id: str) -> str:
+        """
+        Get an entity's friendly name, cached per entity.
+
+        Names only change when the entity is renamed, which is handled by
+        _on_entity_registry_updated().
+
+        Args:
+            entity_id: HA entity_id
+
+        Returns:
+            Friendly name of the entity
+        """
+        name = self._friendly_name_cache.get(entity_id)
+        if name is None:
+            name = self.friendly_name(entity_id)
+            self._friendly_name_cache[entity_id] = name
+        return name
+
+    def _on_entity_registry_updated(self, _event_name, data, _kwargs):
+        """
+        Drop cached friendly names for entities changed in the entity registry.
+
+        Args:
+            _event_name: Event name - unused but required by callback
+            data: Event data (entity_id, and old_entity_id on renames)
+            _kwargs: Additional parameters - unused but required by callback
+        """
+        self._friendly_name_cache.pop(data.get('entity_id'), None)
+        self._friendly_name_cache.pop(data.get('old_entity_id'), None)
+
+    def _get_all_attributes(self, entity_id: str) -> Dict[str, Any]:
+        """
+        Fetch all state attributes of an entity in a single state API call.
+
+        Args:
+            entity_id: HA entity_id
+
+        Returns:
+            Attributes dict (empty if entity has no state)
+        """
+        state = self.get_state(entity_id, attribute="all") or {}
+        return state.get('attributes') or {}
+
     def on_scene_state_changed(self, entity, _attribute, old, new, _kwargs):
         """
         Handle scene state change (detects activations from ANY source).
@@ -355,26 +776,22 @@ class SceneValidator(hass.Hass):
             _kwargs: Additional parameters - unused but required by callback
         """
         # Skip if state didn't actually change
-        if old == new or new is None or new in ("unavailable", "unknown"):
-            self.log(f"Skipping {entity} - no state change", level="DEBUG")
+        # (listen_state only supports equality filters, so "not unavailable"
+        # can't be expressed at registration - bail out before any other work)
+        if new in IGNORED_SCENE_STATES or old == new:
             return
 
         # Debouncing: avoid duplicate validations within window
+        # Only this entity's record is checked; expired records are swept periodically
         now = time.time()
 
-        # Clean old validation records (older than debounce window)
-        cutoff = now - self.validation_debounce
-        self.recent_validations = {
-            ent: ts for ent, ts in self.recent_validations.items()
-            if ts > cutoff
-        }
-
-        if entity in self.recent_validations:
-            last_validation = self.recent_validations[entity]
+        last_validation = self.recent_validations.get(entity)
+        if last_validation is not None:
             if now - last_validation < self.validation_debounce:
-                elapsed = int(now - last_validation)
-                self.log(f"Skipping {entity} - validated {elapsed}s ago "
-                        f"(debounce: {self.validation_debounce}s)", level="DEBUG")
+                if self.debug_logging:
+                    elapsed = int(now - last_validation)
+                    self.log(f"Skipping {entity} - validated {elapsed}s ago "
+                            f"(debounce: {self.validation_debounce}s)", level="DEBUG")
                 return
 
         self.log(f"Scene activated: {entity} (source: ANY - HA/Hue app/switch)")
@@ -421,39 +838,64 @@ class SceneValidator(hass.Hass):
 
         # Check UID exclusions (if scene_uid is available)
         if scene_uid and scene_uid in self.exclude_uids:
-            self.log(f"Scene {entity_id} excluded by UID", level="DEBUG")
+            if self.debug_logging:
+                self.log(f"Scene {entity_id} excluded by UID", level="DEBUG")
             return False
 
-        # Get scene labels
-        scene_labels = self.get_state(entity_id, attribute="labels") or []
+        # Get scene labels (state API call only needed when label filters are configured)
+        if self.include_labels or self.exclude_labels:
+            scene_labels = self._get_all_attributes(entity_id).get('labels') or ()
+        else:
+            scene_labels = ()
 
         # Check exclude labels (takes priority)
         if self.exclude_labels:
-            for label in scene_labels:
-                if label in self.exclude_labels:
-                    self.log(f"Scene {entity_id} excluded by label: {label}", level="DEBUG")
-                    return False
+            excluded = self.exclude_labels.intersection(scene_labels)
+            if excluded:
+                if self.debug_logging:
+                    self.log(f"Scene {entity_id} excluded by label: {', '.join(sorted(excluded))}", level="DEBUG")
+                return False
 
         # Check include labels
         if self.include_labels:
-            has_label = any(label in self.include_labels for label in scene_labels)
-            if not has_label:
-                self.log(f"Scene {entity_id} missing required label", level="DEBUG")
+            if self.include_labels.isdisjoint(scene_labels):
+                if self.debug_logging:
+                    self.log(f"Scene {entity_id} missing required label", level="DEBUG")
                 return False
             return True
 
         # Check name patterns (if no include_labels specified)
         if self.name_patterns:
-            scene_name = self.friendly_name(entity_id)
-            for pattern in self.name_patterns:
-                if re.match(pattern, scene_name):
-                    return True
-            self.log(f"Scene {entity_id} doesn't match name patterns", level="DEBUG")
+            scene_name = self._get_friendly_name(entity_id)
+            if self._name_literal_prefixes and scene_name.startswith(self._name_literal_prefixes):
+                return True
+            if any(pattern.match(scene_name) for pattern in self._name_pattern_res):
+                return True
+            if self.debug_logging:
+                self.log(f"Scene {entity_id} doesn't match name patterns", level="DEBUG")
             return False
 
         # If no filters specified, validate all scenes
         return True
 
+    def _sweep_recent_validations(self, _kwargs):
+        """
+        Drop expired debounce records.
+
+        Runs periodically so the per-activation path never has to scan
+        records for scenes that are not currently firing.
+
+        Args:
+            _kwargs: Scheduler parameters - unused but required by callback
+        """
+        now = time.time()
+
+        cutoff = now - self.validation_debounce
+        self.recent_validations = {
+            ent: ts for ent, ts in self.recent_validations.items()
+            if ts > cutoff
+        }
+
     def check_rate_limits(self, entity_id: str) -> bool:
         """
         Check if validation is within rate limits.
@@ -466,27 +908,27 @@ class SceneValidator(hass.Hass):
         """
         now = time.time()
 
-        # Clean old timestamps (older than 60s)
-        self.validation_timestamps = [
-            ts for ts in self.validation_timestamps if now - ts < 60
-        ]
-
-        if entity_id not in self.scene_validation_timestamps:
-            self.scene_validation_timestamps[entity_id] = []
-
-        self.scene_validation_timestamps[entity_id] = [
-            ts for ts in self.scene_validation_timestamps[entity_id]
-            if now - ts < 60
-        ]
+        # Clean old records (older than 60s) - the deque is in insertion order,
+        # so only expired entries at the left end need to be touched.
+        # Global and per-scene limits share one window: the deque length is the
+        # global count and the counter holds the per-scene counts.
+        cutoff = now - 60
+        validation_timestamps = self.validation_timestamps
+        scene_counts = self.scene_validation_counts
+        while validation_timestamps and validation_timestamps[0][0] <= cutoff:
+            _, expired_entity = validation_timestamps.popleft()
+            scene_counts[expired_entity] -= 1
+            if scene_counts[expired_entity] <= 0:
+                del scene_counts[expired_entity]
 
         # Check global rate limit
-        if len(self.validation_timestamps) >= self.max_validations_per_minute:
+        if len(validation_timestamps) >= self.max_validations_per_minute:
             self.log(f"Global rate limit exceeded ({self.max_validations_per_minute}/min)",
                     level="WARNING")
             return False
 
         # Check per-scene rate limit
-        scene_count = len(self.scene_validation_timestamps[entity_id])
+        scene_count = scene_counts[entity_id]
         if scene_count >= self.max_validations_per_scene_per_minute:
             self.log(f"Per-scene rate limit exceeded for {entity_id} "
                     f"({self.max_validations_per_scene_per_minute}/min)",
@@ -494,8 +936,8 @@ class SceneValidator(hass.Hass):
             return False
 
         # Record this validation
-        self.validation_timestamps.append(now)
-        self.scene_validation_timestamps[entity_id].append(now)
+        validation_timestamps.append((now, entity_id))
+        scene_counts[entity_id] += 1
 
         return True
 
@@ -520,7 +962,11 @@ class SceneValidator(hass.Hass):
                 self.error("perform_scene_validation called without required parameters")
                 return
 
-            self.log(f"Starting validation: {scene_entity}")
+            # Success-path messages are only built with debug_logging (the common
+            # case is a scene that validates fine - failures are always logged)
+            debug_logging = self.debug_logging
+            if debug_logging:
+                self.log(f"Starting validation: {scene_entity}")
 
             # Find scene in inventory by entity_id/name
             scene_data = self.find_scene_in_inventory(scene_entity)
@@ -530,20 +976,19 @@ class SceneValidator(hass.Hass):
                 return
 
             # LEVEL 1: Validate
-            self.log(f"[{scene_entity}] LEVEL 1: Validating scene state")
+            if debug_logging:
+                self.log(f"[{scene_entity}] LEVEL 1: Validating scene state")
             # Reset failure tracking for new validation
-            self.last_validation_failures = []
+            self.last_validation_failures = 0
 
             if self.validate_scene_state(scene_entity, scene_data):
-                self.log(f"[{scene_entity}] [OK] Validation successful")
+                if debug_logging:
+                    self.log(f"[{scene_entity}] [OK] Validation successful")
                 self.record_success()
                 return
 
             # Analyze what failed to determine adaptive delay
-            only_color_temp_failed = (
-                len(self.last_validation_failures) > 0 and
-                all(failure == 'color_temp' for failure in self.last_validation_failures)
-            )
+            only_color_temp_failed = self._only_color_temp_failed()
 
             if only_color_temp_failed:
                 delay_multiplier = 2
@@ -551,7 +996,7 @@ class SceneValidator(hass.Hass):
             else:
                 delay_multiplier = 1
 
-            self.log(f"[{scene_entity}] [FAIL] Validation failed (failures: {set(self.last_validation_failures)})", level="WARNING")
+            self.log(f"[{scene_entity}] [FAIL] Validation failed (failures: {self._describe_failures()})", level="WARNING")
 
             # LEVEL 2: Re-trigger scene (async scheduling to avoid blocking)
             self.log(f"[{scene_entity}] LEVEL 2: Re-triggering scene")
@@ -570,14 +1015,10 @@ class SceneValidator(hass.Hass):
                 )
                 self.log(f"[{scene_entity}] [SCHEDULER] Level 2 validation scheduled in {level2_delay}s", level="INFO")
             except Exception as e:  # noqa: BLE001 - Broad catch to prevent scheduler failures from crashing app
-                self.error(f"[SCHEDULER ERROR] Failed to schedule Level 2 validation: {e}")
-                import traceback
-                self.error(f"Traceback: {traceback.format_exc()}")
+                self.error(f"[SCHEDULER ERROR] Failed to schedule Level 2 validation: {e}", exc_info=True)
 
         except Exception as e:  # noqa: BLE001 - Broad catch to prevent app crash
-            self.error(f"Exception during validation: {e}")
-            import traceback
-            self.error(f"Traceback: {traceback.format_exc()}")
+            self.error(f"Exception during validation: {e}", exc_info=True)
             self.record_failure()
 
     def perform_level2_validation(self, kwargs):
@@ -605,10 +1046,7 @@ class SceneValidator(hass.Hass):
                 return
 
             # Check if validation is possible (inventory format)
-            actions = scene_data.get('actions', [])
-            actions_are_strings = self._is_legacy_action_format(actions)
-
-            if actions_are_strings:
+            if scene_data.get('_legacy_actions'):
                 # Validation impossible due to inventory format
                 # But re-trigger was performed, so consider it successful
                 self.log(f"[{scene_entity}] [OK] Re-trigger completed (validation unavailable due to inventory format)")
@@ -617,7 +1055,7 @@ class SceneValidator(hass.Hass):
 
             # Level 2: Validate after re-trigger
             # Reset failure tracking for Level 2 validation
-            self.last_validation_failures = []
+            self.last_validation_failures = 0
 
             if self.validate_scene_state(scene_entity, scene_data):
                 self.log(f"[{scene_entity}] [OK] Re-trigger successful")
@@ -625,10 +1063,7 @@ class SceneValidator(hass.Hass):
                 return
 
             # Analyze what failed in Level 2 to determine Level 3 delay
-            only_color_temp_failed = (
-                len(self.last_validation_failures) > 0 and
-                all(failure == 'color_temp' for failure in self.last_validation_failures)
-            )
+            only_color_temp_failed = self._only_color_temp_failed()
 
             # If Level 1 already used 2x delay (color temp only) and Level 2 still failed with color temp,
             # use 3x delay for Level 3. Otherwise use original delay.
@@ -640,7 +1075,7 @@ class SceneValidator(hass.Hass):
                 level3_delay = self.validation_delay
                 level3_delay_multiplier = 1
 
-            self.log(f"[{scene_entity}] [FAIL] Re-trigger failed (failures: {set(self.last_validation_failures)})", level="WARNING")
+            self.log(f"[{scene_entity}] [FAIL] Re-trigger failed (failures: {self._describe_failures()})", level="WARNING")
 
             # LEVEL 3: Individual light control (with adaptive delay)
             self.log(f"[{scene_entity}] LEVEL 3: Controlling lights individually in {level3_delay}s")
@@ -655,14 +1090,10 @@ class SceneValidator(hass.Hass):
                 )
                 self.log(f"[{scene_entity}] [SCHEDULER] Level 3 control scheduled in {level3_delay}s", level="INFO")
             except Exception as e:  # noqa: BLE001 - Broad catch to prevent scheduler failures from crashing app
-                self.error(f"[SCHEDULER ERROR] Failed to schedule Level 3 control: {e}")
-                import traceback
-                self.error(f"Traceback: {traceback.format_exc()}")
+                self.error(f"[SCHEDULER ERROR] Failed to schedule Level 3 control: {e}", exc_info=True)
 
         except Exception as e:  # noqa: BLE001 - Broad catch to prevent app crash
-            self.error(f"Exception during level 2/3 validation: {e}")
-            import traceback
-            self.error(f"Traceback: {traceback.format_exc()}")
+            self.error(f"Exception during level 2/3 validation: {e}", exc_info=True)
             self.record_failure()
 
     def perform_level3_control(self, kwargs):
@@ -695,26 +1126,47 @@ class SceneValidator(hass.Hass):
                 return
 
             # Schedule final validation after settle delay instead of blocking the worker thread
-            def _final_level3_validation(_kwargs):
-                self.log(
-                    f"[{scene_entity}] [LEVEL 3] Final validation after {self.level3_settle_delay}s settle delay",
-                    level="INFO",
-                )
-                self.last_validation_failures = []
-                if self.validate_scene_state(scene_entity, scene_data):
-                    self.log(f"[{scene_entity}] [OK] Level 3 successful - final validation PASSED")
-                    self.record_success()
-                else:
-                    self.error(f"[{scene_entity}] [FAIL] Level 3 control executed, but final validation FAILED")
-                    self.error(f"[{scene_entity}] [FAIL] Still failing: {set(self.last_validation_failures)}")
-                    self.record_failure()
+            self.run_in(
+                self.perform_level3_final_validation,
+                self.level3_settle_delay,
+                scene_entity=scene_entity,
+                scene_data=scene_data
+            )
+
+        except Exception as e:  # noqa: BLE001 - Broad catch to prevent app crash
+            self.error(f"Exception during level 3 control: {e}", exc_info=True)
+            self.record_failure()
+
+    def perform_level3_final_validation(self, kwargs):
+        """
+        Validate scene state after Level 3 control and settle delay.
+
+        Args:
+            kwargs: Contains scene_entity and scene_data
+        """
+        try:
+            scene_entity = kwargs.get('scene_entity')
+            scene_data = kwargs.get('scene_data')
 
-            self.run_in(_final_level3_validation, self.level3_settle_delay)
+            if not scene_entity or not scene_data:
+                self.error("perform_level3_final_validation called without required parameters")
+                return
+
+            self.log(
+                f"[{scene_entity}] [LEVEL 3] Final validation after {self.level3_settle_delay}s settle delay",
+                level="INFO",
+            )
+            self.last_validation_failures = 0
+            if self.validate_scene_state(scene_entity, scene_data):
+                self.log(f"[{scene_entity}] [OK] Level 3 successful - final validation PASSED")
+                self.record_success()
+            else:
+                self.error(f"[{scene_entity}] [FAIL] Level 3 control executed, but final validation FAILED")
+                self.error(f"[{scene_entity}] [FAIL] Still failing: {self._describe_failures()}")
+                self.record_failure()
 
         except Exception as e:  # noqa: BLE001 - Broad catch to prevent app crash
-            self.error(f"Exception during level 3 control: {e}")
-            import traceback
-            self.error(f"Traceback: {traceback.format_exc()}")
+            self.error(f"Exception during level 3 final validation: {e}", exc_info=True)
             self.record_failure()
 
     def find_scene_in_inventory(self, entity_id: str) -> Optional[Dict[str, Any]]:
@@ -722,7 +1174,7 @@ class SceneValidator(hass.Hass):
         Find scene data in loaded inventories using entity registry unique_id.
 
         Uses the entity registry to get the Hue scene ID (unique_id) for the given
-        HA entity_id, then searches inventories for that exact scene ID.
+        HA entity_id, then looks up that exact scene ID in the scene index.
 
         This provides 100% reliable scene matching with no ambiguity, unlike the
         previous name-based matching which failed when multiple scenes had the same
@@ -737,23 +1189,16 @@ class SceneValidator(hass.Hass):
         # Get Hue scene ID from entity registry (unique_id = Hue scene ID)
         # The entity registry provides the direct 1:1 mapping:
         # scene.buro_markus_nachtlicht → f0309f80-9480-4b12-a0c3-a026790d87bf
-        hue_scene_id = None
-        for unique_id, mapped_entity_id in self.hue_id_to_entity_id.items():
-            if mapped_entity_id == entity_id:
-                hue_scene_id = unique_id
-                break
+        hue_scene_id = self.entity_id_to_hue_id.get(entity_id)
 
         if not hue_scene_id:
             self.log(f"Could not find Hue scene ID for {entity_id} in entity registry", level="WARNING")
             return None
 
-        # Search inventories for scene with this exact ID
-        for inventory in self.inventories:
-            scenes = inventory.get('resources', {}).get('scenes', {}).get('items', [])
-            for scene in scenes:
-                if scene.get('id') == hue_scene_id:
-                    # Found exact scene match by ID - 100% reliable!
-                    return scene
+        # Exact scene match by ID across all inventories - 100% reliable!
+        scene = self.scene_by_hue_id.get(hue_scene_id)
+        if scene is not None:
+            return scene
 
         # Scene not found in any inventory
         self.log(f"Scene {entity_id} (Hue ID: {hue_scene_id}) not found in inventories", level="WARNING")
@@ -777,33 +1222,43 @@ class SceneValidator(hass.Hass):
             return False
 
         # Check if actions are string representations (inventory format issue)
-        if self._is_legacy_action_format(actions):
+        if scene_data.get('_legacy_actions'):
             self.log("Actions stored as strings - skipping validation, will re-trigger", level="WARNING")
             return False
 
         try:
             all_match = True
 
-            for action in actions:
-                target = action.get('target', {})
-                rid = target.get('rid')
-
-                if not rid:
-                    continue
-
+            # Resolve all targets first so states can be fetched in bulk
+            targets = []
+            for action in scene_data['_parsed_actions']:
                 # Map Hue resource ID to HA entity_id
-                entity_id = self.get_entity_id_from_hue_id(rid)
+                entity_id = self.get_entity_id_from_hue_id(action.rid)
 
                 if not entity_id:
-                    self.log(f"Could not map Hue ID {rid} to entity_id", level="WARNING")
+                    self.log(f"Could not map Hue ID {action.rid} to entity_id", level="WARNING")
                     all_match = False
                     continue
 
-                # Get expected state from action
-                expected = action.get('action', {})
-
-                # Get actual state from HA
-                actual_state = self.get_state(entity_id, attribute="all")
+                # Expected state comes from the parsed action
+                targets.append((entity_id, action))
+
+            # Snapshot states with one state API call instead of one per light.
+            # Taken per validation (not per activation), so Level 2/3 see fresh states.
+            # (a domain query already returns full state dicts; it rejects attribute=)
+            states = self.get_state("light") or {}
+            for entity_id, _ in targets:
+                if entity_id not in states:
+                    # Non-light target - fetch just this entity, not the whole state machine
+                    states[entity_id] = self.get_state(entity_id, attribute="all")
+
+            # Per-light comparison stays scalar (scenes are at most a few dozen
+            # lights); bind the hot callables once for the loop
+            compare = self.compare_light_states
+            get_actual = states.get
+            for entity_id, expected in targets:
+                # Get actual state from snapshot
+                actual_state = get_actual(entity_id)
 
                 if not actual_state:
                     self.log(f"Could not get state for {entity_id}", level="WARNING")
@@ -811,7 +1266,7 @@ class SceneValidator(hass.Hass):
                     continue
 
                 # Compare states
-                if not self.compare_light_states(entity_id, expected, actual_state, scene_entity):
+                if not compare(entity_id, expected, actual_state, scene_entity):
                     all_match = False
 
             return all_match
@@ -823,28 +1278,35 @@ class SceneValidator(hass.Hass):
             self.error(f"Error validating scene state: {e}")
             return False
 
-    def compare_light_states(self, entity_id: str, expected: Dict[str, Any],
+    def compare_light_states(self, entity_id: str, expected: ParsedAction,
                             actual_state: Dict[str, Any], scene_entity: str = "unknown") -> bool:
         """
         Compare expected and actual light states.
 
         Args:
             entity_id: Light entity_id
-            expected: Expected state from scene
+            expected: Expected state from scene (parsed action)
             actual_state: Actual state from HA
             scene_entity: Scene entity_id for logging
 
         Returns:
             True if states match within tolerances, False otherwise
         """
+        # Hoist instance attributes to locals - this runs once per light per validation
+        brightness_tolerance = self.brightness_tolerance
+        color_tolerance = self.color_tolerance
+        color_temp_tolerance = self.color_temp_tolerance
+        debug_logging = self.debug_logging
+        log = self.log
+
         actual_attrs = actual_state.get('attributes', {})
         actual_on = actual_state.get('state') == 'on'
 
         # Check on/off state
-        expected_on = expected.get('on', {}).get('on', False)
+        expected_on = expected.on
         if expected_on != actual_on:
-            self.log(f"[{scene_entity}] [{entity_id}] [ON_OFF] FAIL: exp {'ON' if expected_on else 'OFF'}, got {'ON' if actual_on else 'OFF'}", level="WARNING")
-            self.last_validation_failures.append('on_off')
+            log(f"[{scene_entity}] [{entity_id}] [ON_OFF] FAIL: exp {'ON' if expected_on else 'OFF'}, got {'ON' if actual_on else 'OFF'}", level="WARNING")
+            self.last_validation_failures |= FAILURE_ON_OFF
             return False
 
         # If light should be off, no need to check other attributes
@@ -852,9 +1314,8 @@ class SceneValidator(hass.Hass):
             return True
 
         # Check brightness
-        expected_dimming = expected.get('dimming', {})
-        if expected_dimming and 'brightness' in expected_dimming:
-            expected_brightness = expected_dimming['brightness']
+        expected_brightness = expected.brightness
+        if expected_brightness is not None:
 
             # CRITICAL HUE RULE: When on:true, brightness 0.0 in scene means light will be at 0% in HA state
             # We DON'T convert 0.0 to 1.0 for validation - we accept 0% as the correct actual state
@@ -862,48 +1323,48 @@ class SceneValidator(hass.Hass):
 
             actual_brightness = actual_attrs.get('brightness', 0)
             # Convert HA brightness (0-255) to percentage
-            actual_brightness_pct = (actual_brightness / 255) * 100
+            actual_brightness_pct = actual_brightness * HA_BRIGHTNESS_TO_PCT
             diff = abs(expected_brightness - actual_brightness_pct)
 
-            if diff > self.brightness_tolerance:
-                self.log(f"[{scene_entity}] [{entity_id}] [BRIGHTNESS] FAIL: exp {expected_brightness:.1f}%, got {actual_brightness_pct:.1f}%, diff {diff:.1f}% > tol {self.brightness_tolerance}%", level="WARNING")
-                self.last_validation_failures.append('brightness')
+            if diff > brightness_tolerance:
+                log(f"[{scene_entity}] [{entity_id}] [BRIGHTNESS] FAIL: exp {expected_brightness:.1f}%, got {actual_brightness_pct:.1f}%, diff {diff:.1f}% > tol {brightness_tolerance}%", level="WARNING")
+                self.last_validation_failures |= FAILURE_BRIGHTNESS
                 return False
-            elif self.debug_logging:
-                self.log(f"[{scene_entity}] [{entity_id}] [BRIGHTNESS] OK: exp {expected_brightness:.1f}%, got {actual_brightness_pct:.1f}%, diff {diff:.1f}% < tol {self.brightness_tolerance}%", level="INFO")
+            elif debug_logging:
+                log(f"[{scene_entity}] [{entity_id}] [BRIGHTNESS] OK: exp {expected_brightness:.1f}%, got {actual_brightness_pct:.1f}%, diff {diff:.1f}% < tol {brightness_tolerance}%", level="INFO")
 
         # Check color (XY)
-        expected_color = expected.get('color', {})
-        if expected_color and 'xy' in expected_color:
-            expected_xy = expected_color['xy']
+        if expected.xy_x is not None:
+            expected_x, expected_y = expected.xy_x, expected.xy_y
             actual_xy = actual_attrs.get('xy_color')
 
             # Only validate if light has xy_color in state (skip if in CT mode)
             if actual_xy:
-                x_diff = abs(expected_xy['x'] - actual_xy[0])
-                y_diff = abs(expected_xy['y'] - actual_xy[1])
-                if x_diff > self.color_tolerance or y_diff > self.color_tolerance:
-                    self.log(f"[{scene_entity}] [{entity_id}] [COLOR_XY] FAIL: exp ({expected_xy['x']:.3f}, {expected_xy['y']:.3f}), got ({actual_xy[0]:.3f}, {actual_xy[1]:.3f}), diff (x:{x_diff:.3f}, y:{y_diff:.3f}) > tol {self.color_tolerance}", level="WARNING")
-                    self.last_validation_failures.append('color')
+                # Per-axis (L-infinity) tolerance as documented (CIE xy, +/- color_tolerance)
+                actual_x, actual_y = actual_xy[0], actual_xy[1]
+                x_diff = abs(expected_x - actual_x)
+                y_diff = abs(expected_y - actual_y)
+                if x_diff > color_tolerance or y_diff > color_tolerance:
+                    log(f"[{scene_entity}] [{entity_id}] [COLOR_XY] FAIL: exp ({expected_x:.3f}, {expected_y:.3f}), got ({actual_x:.3f}, {actual_y:.3f}), diff (x:{x_diff:.3f}, y:{y_diff:.3f}) > tol {color_tolerance}", level="WARNING")
+                    self.last_validation_failures |= FAILURE_COLOR
                     return False
-                elif self.debug_logging:
-                    self.log(f"[{scene_entity}] [{entity_id}] [COLOR_XY] OK: exp ({expected_xy['x']:.3f}, {expected_xy['y']:.3f}), got ({actual_xy[0]:.3f}, {actual_xy[1]:.3f}), diff (x:{x_diff:.3f}, y:{y_diff:.3f}) < tol {self.color_tolerance}", level="INFO")
+                elif debug_logging:
+                    log(f"[{scene_entity}] [{entity_id}] [COLOR_XY] OK: exp ({expected_x:.3f}, {expected_y:.3f}), got ({actual_x:.3f}, {actual_y:.3f}), diff (x:{x_diff:.3f}, y:{y_diff:.3f}) < tol {color_tolerance}", level="INFO")
 
         # Check color temperature
-        if 'color_temperature' in expected:
-            if expected['color_temperature']:
-                expected_ct = expected['color_temperature'].get('mirek')
-                actual_ct = actual_attrs.get('color_temp')
-
-                # Only validate if light has color_temp in state (skip if in XY mode)
-                if actual_ct:
-                    diff = abs(expected_ct - actual_ct)
-                    if diff > self.color_temp_tolerance:
-                        self.log(f"[{scene_entity}] [{entity_id}] [COLOR_TEMP] FAIL: exp {expected_ct}, got {actual_ct}, diff {diff} > tol {self.color_temp_tolerance}", level="WARNING")
-                        self.last_validation_failures.append('color_temp')
-                        return False
-                    elif self.debug_logging:
-                        self.log(f"[{scene_entity}] [{entity_id}] [COLOR_TEMP] OK: exp {expected_ct}, got {actual_ct}, diff {diff} < tol {self.color_temp_tolerance}", level="INFO")
+        expected_ct = expected.mirek
+        if expected_ct is not None:
+            actual_ct = actual_attrs.get('color_temp')
+
+            # Only validate if light has color_temp in state (skip if in XY mode)
+            if actual_ct:
+                diff = abs(expected_ct - actual_ct)
+                if diff > color_temp_tolerance:
+                    log(f"[{scene_entity}] [{entity_id}] [COLOR_TEMP] FAIL: exp {expected_ct}, got {actual_ct}, diff {diff} > tol {color_temp_tolerance}", level="WARNING")
+                    self.last_validation_failures |= FAILURE_COLOR_TEMP
+                    return False
+                elif debug_logging:
+                    log(f"[{scene_entity}] [{entity_id}] [COLOR_TEMP] OK: exp {expected_ct}, got {actual_ct}, diff {diff} < tol {color_temp_tolerance}", level="INFO")
 
         return True
 
@@ -911,6 +1372,9 @@ class SceneValidator(hass.Hass):
         """
         Control each light individually to achieve desired state.
 
+        Lights with identical target states share one light/turn_on call;
+        all off lights share one light/turn_off call.
+
         Args:
             scene_data: Scene data from inventory
 
@@ -923,64 +1387,65 @@ class SceneValidator(hass.Hass):
             return False
 
         # Check if actions are string representations (inventory format issue)
-        if self._is_legacy_action_format(actions):
+        if scene_data.get('_legacy_actions'):
             self.log("Cannot control lights - actions stored as strings (inventory format issue)", level="WARNING")
             return False
 
         all_success = True
 
-        for action in actions:
-            target = action.get('target', {})
-            rid = target.get('rid')
-
-            if not rid:
-                continue
+        # Lights sharing a target state are sent in one service call
+        # (entity_id list) instead of one call per light
+        off_entities = []
+        on_groups = {}
 
-            entity_id = self.get_entity_id_from_hue_id(rid)
+        for action in scene_data['_parsed_actions']:
+            entity_id = self.get_entity_id_from_hue_id(action.rid)
 
             if not entity_id:
-                self.log(f"Could not map Hue ID {rid} to entity_id", level="WARNING")
+                self.log(f"Could not map Hue ID {action.rid} to entity_id", level="WARNING")
                 all_success = False
                 continue
 
-            # Build service call parameters
-            expected = action.get('action', {})
-            service_data = {"entity_id": entity_id}
-
             # On/off
-            expected_on = expected.get('on', {}).get('on', False)
-            if not expected_on:
-                self.call_service("light/turn_off", **service_data)
+            if not action.on:
+                off_entities.append(entity_id)
                 continue
 
             # Brightness
-            dimming = expected.get('dimming', {})
-            if dimming and 'brightness' in dimming:
-                brightness_pct = dimming['brightness']
-
+            brightness = None
+            if action.brightness is not None:
                 # CRITICAL HUE RULE: When on:true, brightness 0.0 means "minimum brightness" (~1%), NOT off
                 # This is Hue-specific behavior - see CLAUDE.md for details
-                if brightness_pct == 0.0:
-                    brightness_pct = 1.0  # Minimum brightness for ON lights
+                brightness_pct = action.brightness or 1.0  # Minimum brightness for ON lights
 
-                # Convert percentage to 0-255
-                brightness = int((brightness_pct / 100) * 255)
-                service_data['brightness'] = max(1, min(brightness, 255))  # Clamp to valid range 1-255
+                # Convert percentage to 0-255, clamped to valid range 1-255
+                # (epsilon keeps 100% at 255: 100 * 2.55 == 254.99999999999997)
+                brightness = int(brightness_pct * PCT_TO_HA_BRIGHTNESS + 1e-9) or 1
+                if brightness > 255:
+                    brightness = 255
+
+            # Group by resulting service parameters (brightness, xy, color temperature)
+            key = (brightness, action.xy_x, action.xy_y, action.mirek or None)
+            on_groups.setdefault(key, []).append(entity_id)
+
+        if off_entities:
+            self.call_service("light/turn_off", entity_id=off_entities)
+
+        for (brightness, xy_x, xy_y, color_temp), entity_ids in on_groups.items():
+            # Build service call parameters
+            service_data = {"entity_id": entity_ids}
+            if brightness is not None:
+                service_data['brightness'] = brightness
 
             # Color (XY)
-            color = expected.get('color', {})
-            if color and 'xy' in color:
-                xy = color['xy']
-                service_data['xy_color'] = [xy['x'], xy['y']]
+            if xy_x is not None:
+                service_data['xy_color'] = [xy_x, xy_y]
 
             # Color temperature
-            if 'color_temperature' in expected:
-                if expected['color_temperature']:
-                    ct = expected['color_temperature'].get('mirek')
-                    if ct:
-                        service_data['color_temp'] = ct
+            if color_temp:
+                service_data['color_temp'] = color_temp
 
-            # Turn on light with parameters
+            # Turn on lights with parameters
             self.call_service("light/turn_on", **service_data)
 
         return all_success
@@ -1000,21 +1465,38 @@ class SceneValidator(hass.Hass):
             HA entity_id or None if not found
         """
         # Try exact match first (resource ID is the unique_id)
-        if hue_resource_id in self.hue_id_to_entity_id:
-            return self.hue_id_to_entity_id[hue_resource_id]
+        entity_id = self.hue_id_to_entity_id.get(hue_resource_id)
+        if entity_id is not None:
+            return entity_id
 
-        # Try partial match (unique_id contains resource ID with delimiters)
-        for unique_id, entity_id in self.hue_id_to_entity_id.items():
-            if (unique_id.endswith(hue_resource_id) or
-                f"_{hue_resource_id}" in unique_id or
-                f"-{hue_resource_id}" in unique_id):
-                return entity_id
+        # Resolved before (hit or miss)?
+        if hue_resource_id in self._hue_lookup_cache:
+            return self._hue_lookup_cache[hue_resource_id]
 
-        return None
+        # Try suffix index (unique_id ends with resource ID)
+        entity_id = self._hue_id_suffix_index.get(hue_resource_id)
+
+        if entity_id is None:
+            # Try partial match (unique_id contains resource ID with delimiters)
+            for unique_id, mapped_entity_id in self.hue_id_to_entity_id.items():
+                if (unique_id.endswith(hue_resource_id) or
+                    f"_{hue_resource_id}" in unique_id or
+                    f"-{hue_resource_id}" in unique_id):
+                    entity_id = mapped_entity_id
+                    break
+
+        self._hue_lookup_cache[hue_resource_id] = entity_id
+        return entity_id
 
     def record_success(self):
         """Record successful validation for circuit breaker."""
-        if self.circuit_breaker_state == 'HALF_OPEN':
+        # CLOSED is the steady state - check it first
+        if self.circuit_breaker_state == 'CLOSED':
+            # Reset failure count on success
+            if self.circuit_breaker_failures > 0:
+                self.circuit_breaker_failures = 0
+
+        elif self.circuit_breaker_state == 'HALF_OPEN':
             self.circuit_breaker_successes += 1
             self.log(f"Circuit breaker HALF_OPEN: {self.circuit_breaker_successes}/"
                     f"{self.cb_success_threshold} successes")
@@ -1025,21 +1507,10 @@ class SceneValidator(hass.Hass):
                 self.circuit_breaker_successes = 0
                 self.log("Circuit breaker CLOSED (recovered)")
 
-        elif self.circuit_breaker_state == 'CLOSED':
-            # Reset failure count on success
-            if self.circuit_breaker_failures > 0:
-                self.circuit_breaker_failures = 0
-
     def record_failure(self):
         """Record validation failure for circuit breaker."""
-        if self.circuit_breaker_state == 'HALF_OPEN':
-            # Failure during half-open state - re-open circuit
-            self.circuit_breaker_state = 'OPEN'
-            self.circuit_breaker_opened_at = time.time()
-            self.circuit_breaker_successes = 0
-            self.error("Circuit breaker re-OPENED (half-open test failed)")
-
-        elif self.circuit_breaker_state == 'CLOSED':
+        # CLOSED is the steady state - check it first
+        if self.circuit_breaker_state == 'CLOSED':
             self.circuit_breaker_failures += 1
             self.log(f"Circuit breaker failures: {self.circuit_breaker_failures}/"
                     f"{self.cb_failure_threshold}")
@@ -1048,3 +1519,10 @@ class SceneValidator(hass.Hass):
                 self.circuit_breaker_state = 'OPEN'
                 self.circuit_breaker_opened_at = time.time()
                 self.error("Circuit breaker OPENED (threshold reached)")
+
+        elif self.circuit_breaker_state == 'HALF_OPEN':
+            # Failure during half-open state - re-open circuit
+            self.circuit_breaker_state = 'OPEN'
+            self.circuit_breaker_opened_at = time.time()
+            self.circuit_breaker_successes = 0
+            self.error("Circuit breaker re-OPENED (half-open test failed)")
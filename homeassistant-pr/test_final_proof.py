@@ -13,6 +13,7 @@ import json
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 import aiohttp
 from aiohue.v2 import HueBridgeV2
 
@@ -25,6 +26,29 @@ BRIDGE_IP = "192.168.188.134"
 HA_TOKEN = None
 BRIDGE_USERNAME = None
 
+# Shared HA API session (keep-alive connection reused across calls)
+_SESSION: Optional[aiohttp.ClientSession] = None
+
+
+async def _get_session():
+    """Return the shared HA API session, creating it on first use"""
+    global _SESSION
+
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=30)
+        )
+    return _SESSION
+
+
+async def _close_session():
+    """Close the shared HA API session"""
+    global _SESSION
+
+    if _SESSION is not None:
+        await _SESSION.close()
+        _SESSION = None
+
 
 async def setup():
     """Load configuration"""
@@ -65,7 +89,7 @@ async def setup():
     return True
 
 
-async def call_ha_api(endpoint, method="GET", data=None):
+async def call_ha_api(endpoint, method="GET", data=None, params=None):
     """Call HA API"""
     url = f"{HA_URL}/api/{endpoint}"
     headers = {
@@ -73,47 +97,48 @@ async def call_ha_api(endpoint, method="GET", data=None):
         "Content-Type": "application/json"
     }
 
-    async with aiohttp.ClientSession() as session:
-        if method == "GET":
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    print(f"[ERROR] API call failed: {resp.status} - {text[:100]}")
-                    return None
-                return await resp.json()
-        elif method == "POST":
-            async with session.post(url, headers=headers, json=data) as resp:
-                if resp.status not in [200, 201]:
-                    text = await resp.text()
-                    print(f"[ERROR] API call failed: {resp.status} - {text[:100]}")
-                    return None
-                return await resp.json()
+    session = await _get_session()
+    if method == "GET":
+        async with session.get(url, headers=headers, params=params) as resp:
+            if resp.status != 200:
+                text = await resp.text()
+                print(f"[ERROR] API call failed: {resp.status} - {text[:100]}")
+                return None
+            return await resp.json()
+    elif method == "POST":
+        async with session.post(url, headers=headers, json=data) as resp:
+            if resp.status not in [200, 201]:
+                text = await resp.text()
+                print(f"[ERROR] API call failed: {resp.status} - {text[:100]}")
+                return None
+            return await resp.json()
 
 
 async def get_scene_activations(since):
     """Get scene activations from history"""
     end_time = datetime.now(timezone.utc)
     history = await call_ha_api(
-        f"history/period/{since.isoformat()}?filter_entity_id={TEST_SCENE_ENTITY}&end_time={end_time.isoformat()}"
+        f"history/period/{since.isoformat()}",
+        params={"filter_entity_id": TEST_SCENE_ENTITY, "end_time": end_time.isoformat()}
     )
 
     if not history or not history[0]:
         return []
 
+    # Normalize the cutoff to UTC once. HA reports last_changed as ISO-8601
+    # UTC, which sorts the same as the datetimes it encodes, so records are
+    # filtered by string comparison without parsing each timestamp.
+    since_utc = since.replace(tzinfo=timezone.utc) if since.tzinfo is None else since.astimezone(timezone.utc)
+    since_iso = since_utc.isoformat(timespec="microseconds")
+
     activations = []
     for state in history[0]:
-        if "last_changed" in state:
-            # Parse the timestamp with timezone awareness
-            state_time_str = state["last_changed"].replace("Z", "+00:00")
-            state_time = datetime.fromisoformat(state_time_str)
-
-            # Convert both to UTC for comparison
-            since_utc = since.replace(tzinfo=timezone.utc) if since.tzinfo is None else since
-            if state_time > since_utc:
-                activations.append({
-                    "time": state["last_changed"],
-                    "state": state.get("state", "")
-                })
+        last_changed = state.get("last_changed")
+        if last_changed and last_changed.replace("Z", "+00:00") > since_iso:
+            activations.append({
+                "time": last_changed,
+                "state": state.get("state", "")
+            })
     return activations
 
 
@@ -222,6 +247,14 @@ async def test_tc3_fixed():
         return 1
 
 
+async def main():
+    """Run TC3 and close the shared HA API session afterwards"""
+    try:
+        return await test_tc3_fixed()
+    finally:
+        await _close_session()
+
+
 if __name__ == "__main__":
-    exit_code = asyncio.run(test_tc3_fixed())
+    exit_code = asyncio.run(main())
     sys.exit(exit_code)
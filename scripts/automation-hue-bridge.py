@@ -62,17 +62,31 @@ if VENV_PATH.exists():
 import argparse
 import asyncio
 import json
+import re
 from datetime import datetime
 from typing import Dict, List, Optional
 
-# Import shared JSON encoder (now with enum handling, circular reference protection, recursive serialization)
-from common.json_utils import CustomJSONEncoder
+# Import shared JSON helpers (enum handling, circular reference protection, orjson when installed)
+from common.json_utils import loads_json, write_json_file, write_json_stdout
+# Import shared model attribute helpers
+from common.model_utils import str_or_none
 
 
 # Default paths
 DEFAULT_CONFIG_FILE = Path(__file__).parent.parent / "bridges" / "config.json"
 DEFAULT_AUTOMATIONS_DIR = Path(__file__).parent.parent / "bridges" / "automations"
 
+# Characters not allowed in output filenames (anything but alphanumeric, underscore, hyphen)
+FILENAME_INVALID_CHARS = re.compile(r'[^a-zA-Z0-9_-]')
+
+# Maximum number of bridges captured at the same time
+MAX_CONCURRENT_BRIDGES = 8
+
+# Maximum open connections per bridge. Hue bridges throttle (HTTP 429) well
+# below what an unbounded pool could send; a capture issues only a handful
+# of requests per bridge, so capping connections keeps it under that limit.
+MAX_CONNECTIONS_PER_BRIDGE = 4
+
 
 def sanitize_filename(name: str) -> str:
     """
@@ -84,12 +98,97 @@ def sanitize_filename(name: str) -> str:
     Returns:
         str: Sanitized name suitable for filename
     """
-    import re
     # Replace spaces with underscores
     sanitized = name.replace(' ', '_')
     # Remove or replace special characters, keep only alphanumeric, underscore, hyphen
-    sanitized = re.sub(r'[^a-zA-Z0-9_-]', '', sanitized)
-    return sanitized
+    return FILENAME_INVALID_CHARS.sub('', sanitized)
+
+
+def _smart_scene_dict(scene) -> Dict:
+    """
+    Build the output record for a smart scene.
+
+    Args:
+        scene: aiohue SmartScene
+
+    Returns:
+        dict: Smart scene record (nested model objects are left to the JSON encoder)
+    """
+    active_timeslot = getattr(scene, 'active_timeslot', None)
+    return {
+        "id": scene.id,
+        "type": str_or_none(getattr(scene, 'type', None)),
+        "metadata": getattr(scene, 'metadata', None),
+        "group": str_or_none(getattr(scene, 'group', None)),
+        "week_timeslots": [
+            {
+                "timeslots": [
+                    {
+                        "start_time": getattr(ts, 'start_time', None) or None,
+                        "target": str_or_none(getattr(ts, 'target', None))
+                    }
+                    for ts in getattr(day, 'timeslots', ())
+                ],
+                "recurrence": list(getattr(day, 'recurrence', ()))
+            }
+            for day in getattr(scene, 'week_timeslots', None) or ()
+        ],
+        "state": getattr(scene, 'state', None),
+        "active_timeslot": {
+            "timeslot_id": active_timeslot.timeslot_id,
+            "weekday": getattr(active_timeslot, 'weekday', None)
+        } if active_timeslot else None,
+        "transition_duration": getattr(scene, 'transition_duration', None),
+    }
+
+
+def _behavior_instance_dict(instance) -> Dict:
+    """
+    Build the output record for a behavior instance.
+
+    Args:
+        instance: aiohue BehaviorInstance
+
+    Returns:
+        dict: Behavior instance record
+    """
+    return {
+        "id": instance.id,
+        "type": str_or_none(getattr(instance, 'type', None)),
+        "metadata": getattr(instance, 'metadata', None),
+        "script_id": getattr(instance, 'script_id', None),
+        "enabled": getattr(instance, 'enabled', None),
+        "status": getattr(instance, 'status', None),
+        "configuration": getattr(instance, 'configuration', None),
+        "state": getattr(instance, 'state', None),
+        "last_error": getattr(instance, 'last_error', None),
+        "dependees": [str(d) for d in getattr(instance, 'dependees', None) or ()],
+        "migrated_from": getattr(instance, 'migrated_from', None),
+    }
+
+
+def _behavior_script_dict(script) -> Dict:
+    """
+    Build the output record for a behavior script.
+
+    Args:
+        script: aiohue BehaviorScript
+
+    Returns:
+        dict: Behavior script record
+    """
+    return {
+        "id": script.id,
+        "type": str_or_none(getattr(script, 'type', None)),
+        "metadata": getattr(script, 'metadata', None),
+        "description": getattr(script, 'description', None),
+        "configuration_schema": getattr(script, 'configuration_schema', None),
+        "trigger_schema": getattr(script, 'trigger_schema', None),
+        "state_schema": getattr(script, 'state_schema', None),
+        "version": getattr(script, 'version', None),
+        "supported_features": list(getattr(script, 'supported_features', ())),
+        "max_number_instances": getattr(script, 'max_number_instances', None),
+    }
 
 
 def parse_arguments():
@@ -165,9 +264,8 @@ def load_config(filepath: str) -> Optional[Dict]:
         dict: Bridge configuration data, or None on error
     """
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        return data
+        # Single read + parse (orjson when installed; it raises a json.JSONDecodeError subclass)
+        return loads_json(Path(filepath).read_bytes())
     except FileNotFoundError:
         print(f"Error: Config file not found: {filepath}", file=sys.stderr)
         print("Run discover-hue-bridges.py first to create it.", file=sys.stderr)
@@ -180,10 +278,12 @@ def load_config(filepath: str) -> Optional[Dict]:
         return None
 
 
-def save_automations(automations: Dict, bridge_id: str, bridge_name: str, output_dir: str) -> bool:
+def save_automations(automations: Dict, bridge_id: str, bridge_name: str, output_dir: str) -> Optional[Path]:
     """
     Save bridge automation data to JSON file.
 
+    The output directory must already exist (capture_bridge_automations creates it once).
+
     Args:
         automations (dict): Automation data
         bridge_id (str): Bridge ID
@@ -191,25 +291,22 @@ def save_automations(automations: Dict, bridge_id: str, bridge_name: str, output
         output_dir (str): Output directory path
 
     Returns:
-        bool: True if successful, False otherwise
+        Path: Written file if successful, None otherwise
     """
     try:
-        # Ensure output directory exists
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
-
         # Use format: {name}-{bridge_id}-automations.json
         sanitized_name = sanitize_filename(bridge_name)
         output_file = Path(output_dir) / f"{sanitized_name}-{bridge_id}-automations.json"
-        with open(output_file, 'w') as f:
-            json.dump(automations, f, indent=2, cls=CustomJSONEncoder)
+        write_json_file(output_file, automations, stream=True)
 
-        return True
+        return output_file
     except Exception as e:
         print(f"Error saving automations: {e}", file=sys.stderr)
-        return False
+        return None
 
 
-async def capture_automations(bridge_ip: str, username: str, client_key: Optional[str] = None) -> Optional[Dict]:
+async def capture_automations(bridge_ip: str, username: str, client_key: Optional[str] = None,
+                              log_prefix: str = "", websession=None) -> Optional[Dict]:
     """
     Connect to a Hue bridge and retrieve comprehensive automation data.
 
@@ -217,22 +314,27 @@ async def capture_automations(bridge_ip: str, username: str, client_key: Optiona
         bridge_ip (str): IP address of the bridge
         username (str): API username
         client_key (str, optional): Client key for V2 API
+        log_prefix (str, optional): Prefix for progress lines (keeps concurrent bridges apart)
+        websession (aiohttp.ClientSession, optional): Shared HTTP session (bridge creates its own if None)
 
     Returns:
         dict: Complete automation data, or None on error
     """
+    def log(message: str = "", **kwargs):
+        print(f"{log_prefix}{message}", **kwargs)
+
     try:
         from aiohue.v2 import HueBridgeV2
 
-        print(f"   🔄 Connecting to bridge at {bridge_ip}...")
+        log(f"   🔄 Connecting to bridge at {bridge_ip}...")
 
-        bridge = HueBridgeV2(bridge_ip, username)
+        bridge = HueBridgeV2(bridge_ip, username, websession=websession)
 
         try:
             await bridge.initialize()
-            print(f"   ✅ Connected successfully")
+            log(f"   ✅ Connected successfully")
         except Exception as e:
-            print(f"   ❌ Failed to initialize bridge: {e}", file=sys.stderr)
+            log(f"   ❌ Failed to initialize bridge: {e}", file=sys.stderr)
             await bridge.close()
             return None
 
@@ -246,103 +348,59 @@ async def capture_automations(bridge_ip: str, username: str, client_key: Optiona
 
         # Retrieve Smart Scenes
         try:
-            print(f"      📅 Retrieving smart scenes...")
+            log(f"      📅 Retrieving smart scenes...")
             smart_scenes = bridge.scenes.smart_scene.items
             automations["automations"]["smart_scenes"] = {
                 "count": len(smart_scenes),
-                "items": [
-                    {
-                        "id": scene.id,
-                        "type": str(scene.type) if hasattr(scene, 'type') else None,
-                        "metadata": scene.metadata.__dict__ if hasattr(scene, 'metadata') and scene.metadata is not None else None,
-                        "group": str(scene.group) if hasattr(scene, 'group') and scene.group is not None else None,
-                        "week_timeslots": [
-                            {
-                                "timeslots": [
-                                    {
-                                        "start_time": ts.start_time.__dict__ if hasattr(ts, 'start_time') and ts.start_time else None,
-                                        "target": str(ts.target) if hasattr(ts, 'target') and ts.target else None
-                                    }
-                                    for ts in day.timeslots
-                                ] if hasattr(day, 'timeslots') else [],
-                                "recurrence": list(day.recurrence) if hasattr(day, 'recurrence') else []
-                            }
-                            for day in scene.week_timeslots
-                        ] if hasattr(scene, 'week_timeslots') and scene.week_timeslots else [],
-                        "state": scene.state if hasattr(scene, 'state') else None,
-                        "active_timeslot": {
-                            "timeslot_id": scene.active_timeslot.timeslot_id if scene.active_timeslot else None,
-                            "weekday": scene.active_timeslot.weekday if scene.active_timeslot and hasattr(scene.active_timeslot, 'weekday') else None
-                        } if hasattr(scene, 'active_timeslot') and scene.active_timeslot else None,
-                        "transition_duration": scene.transition_duration if hasattr(scene, 'transition_duration') else None,
-                    }
-                    for scene in smart_scenes
-                ]
+                "items": [_smart_scene_dict(scene) for scene in smart_scenes]
             }
-            print(f"      ✅ Found {len(smart_scenes)} smart scenes")
+            log(f"      ✅ Found {len(smart_scenes)} smart scenes")
         except Exception as e:
-            print(f"      ⚠️  Error retrieving smart scenes: {e}", file=sys.stderr)
+            log(f"      ⚠️  Error retrieving smart scenes: {e}", file=sys.stderr)
             automations["automations"]["smart_scenes"] = {"error": str(e)}
 
         # Retrieve Behavior Instances
         try:
-            print(f"      🤖 Retrieving behavior instances...")
+            log(f"      🤖 Retrieving behavior instances...")
             behavior_instances = bridge.config.behavior_instance.items
+            instance_items = [_behavior_instance_dict(instance) for instance in behavior_instances]
             automations["automations"]["behavior_instances"] = {
                 "count": len(behavior_instances),
-                "items": [
-                    {
-                        "id": instance.id,
-                        "type": str(instance.type) if hasattr(instance, 'type') else None,
-                        "metadata": instance.metadata.__dict__ if hasattr(instance, 'metadata') and instance.metadata is not None else None,
-                        "script_id": instance.script_id if hasattr(instance, 'script_id') else None,
-                        "enabled": instance.enabled if hasattr(instance, 'enabled') else None,
-                        "status": instance.status if hasattr(instance, 'status') else None,
-                        "configuration": instance.configuration if hasattr(instance, 'configuration') else None,
-                        "state": instance.state if hasattr(instance, 'state') else None,
-                        "last_error": instance.last_error if hasattr(instance, 'last_error') else None,
-                        "dependees": [str(d) for d in instance.dependees] if hasattr(instance, 'dependees') and instance.dependees else [],
-                        "migrated_from": instance.migrated_from if hasattr(instance, 'migrated_from') else None,
-                    }
-                    for instance in behavior_instances
-                ]
+                "enabled_count": sum(1 for item in instance_items if item["enabled"]),
+                "items": instance_items
             }
-            print(f"      ✅ Found {len(behavior_instances)} behavior instances")
+            log(f"      ✅ Found {len(behavior_instances)} behavior instances")
         except Exception as e:
-            print(f"      ⚠️  Error retrieving behavior instances: {e}", file=sys.stderr)
+            log(f"      ⚠️  Error retrieving behavior instances: {e}", file=sys.stderr)
             automations["automations"]["behavior_instances"] = {"error": str(e)}
 
         # Retrieve Behavior Scripts
         try:
-            print(f"      📜 Retrieving behavior scripts...")
+            log(f"      📜 Retrieving behavior scripts...")
             behavior_scripts = bridge.config.behavior_script.items
             automations["automations"]["behavior_scripts"] = {
                 "count": len(behavior_scripts),
-                "items": [
-                    {
-                        "id": script.id,
-                        "type": str(script.type) if hasattr(script, 'type') else None,
-                        "metadata": script.metadata.__dict__ if hasattr(script, 'metadata') and script.metadata is not None else None,
-                        "description": script.description if hasattr(script, 'description') else None,
-                        "configuration_schema": script.configuration_schema if hasattr(script, 'configuration_schema') else None,
-                        "trigger_schema": script.trigger_schema if hasattr(script, 'trigger_schema') else None,
-                        "state_schema": script.state_schema if hasattr(script, 'state_schema') else None,
-                        "version": script.version if hasattr(script, 'version') else None,
-                        "supported_features": list(script.supported_features) if hasattr(script, 'supported_features') else [],
-                        "max_number_instances": script.max_number_instances if hasattr(script, 'max_number_instances') else None,
-                    }
-                    for script in behavior_scripts
-                ]
+                "items": [_behavior_script_dict(script) for script in behavior_scripts]
             }
-            print(f"      ✅ Found {len(behavior_scripts)} behavior scripts")
+            log(f"      ✅ Found {len(behavior_scripts)} behavior scripts")
         except Exception as e:
-            print(f"      ⚠️  Error retrieving behavior scripts: {e}", file=sys.stderr)
+            log(f"      ⚠️  Error retrieving behavior scripts: {e}", file=sys.stderr)
             automations["automations"]["behavior_scripts"] = {"error": str(e)}
 
-        # Retrieve Geofence Clients (via raw API)
+        # Geofence clients and geolocation are the only raw API round trips;
+        # request both concurrently, then handle each result in turn
+        log(f"      📍 Retrieving geofence clients...")
+        log(f"      🌍 Retrieving geolocation...")
+        geofence_response, geolocation_response = await asyncio.gather(
+            bridge.request("get", "clip/v2/resource/geofence_client"),
+            bridge.request("get", "clip/v2/resource/geolocation"),
+            return_exceptions=True,
+        )
+
+        # Geofence Clients (via raw API)
         try:
-            print(f"      📍 Retrieving geofence clients...")
-            geofence_response = await bridge.request("get", "clip/v2/resource/geofence_client")
+            if isinstance(geofence_response, BaseException):
+                raise geofence_response
 
             if geofence_response and 'data' in geofence_response:
                 geofence_clients = geofence_response['data']
@@ -350,44 +408,44 @@ async def capture_automations(bridge_ip: str, username: str, client_key: Optiona
                     "count": len(geofence_clients),
                     "items": geofence_clients
                 }
-                print(f"      ✅ Found {len(geofence_clients)} geofence clients")
+                log(f"      ✅ Found {len(geofence_clients)} geofence clients")
             else:
                 automations["automations"]["geofence_clients"] = {"count": 0, "items": []}
-                print(f"      ℹ️  No geofence clients found")
+                log(f"      ℹ️  No geofence clients found")
         except Exception as e:
-            print(f"      ⚠️  Error retrieving geofence clients: {e}", file=sys.stderr)
+            log(f"      ⚠️  Error retrieving geofence clients: {e}", file=sys.stderr)
             automations["automations"]["geofence_clients"] = {"error": str(e)}
 
-        # Retrieve Geolocation (via raw API)
+        # Geolocation (via raw API)
         try:
-            print(f"      🌍 Retrieving geolocation...")
-            geolocation_response = await bridge.request("get", "clip/v2/resource/geolocation")
+            if isinstance(geolocation_response, BaseException):
+                raise geolocation_response
 
             if geolocation_response and 'data' in geolocation_response and geolocation_response['data']:
                 # Usually only one geolocation entry
                 geolocation = geolocation_response['data'][0]
                 automations["automations"]["geolocation"] = geolocation
-                print(f"      ✅ Retrieved geolocation data")
+                log(f"      ✅ Retrieved geolocation data")
             else:
                 automations["automations"]["geolocation"] = None
-                print(f"      ℹ️  No geolocation data found")
+                log(f"      ℹ️  No geolocation data found")
         except Exception as e:
-            print(f"      ⚠️  Error retrieving geolocation: {e}", file=sys.stderr)
+            log(f"      ⚠️  Error retrieving geolocation: {e}", file=sys.stderr)
             automations["automations"]["geolocation"] = {"error": str(e)}
 
         # Get bridge config/info
         try:
-            print(f"      ⚙️  Retrieving bridge configuration...")
+            log(f"      ⚙️  Retrieving bridge configuration...")
             config = bridge.config
             automations["bridge_info"]["config"] = {
-                "bridge_id": config.bridge_id if hasattr(config, 'bridge_id') else None,
-                "name": config.name if hasattr(config, 'name') else None,
-                "model_id": config.model_id if hasattr(config, 'model_id') else None,
-                "sw_version": config.sw_version if hasattr(config, 'sw_version') else None,
+                "bridge_id": getattr(config, 'bridge_id', None),
+                "name": getattr(config, 'name', None),
+                "model_id": getattr(config, 'model_id', None),
+                "sw_version": getattr(config, 'sw_version', None),
             }
-            print(f"      ✅ Retrieved bridge configuration")
+            log(f"      ✅ Retrieved bridge configuration")
         except Exception as e:
-            print(f"      ⚠️  Error retrieving config: {e}", file=sys.stderr)
+            log(f"      ⚠️  Error retrieving config: {e}", file=sys.stderr)
             automations["bridge_info"]["config"] = {"error": str(e)}
 
         # Close bridge connection
@@ -396,10 +454,10 @@ async def capture_automations(bridge_ip: str, username: str, client_key: Optiona
         return automations
 
     except ImportError as e:
-        print(f"Error: Required library not found: {e}", file=sys.stderr)
+        log(f"Error: Required library not found: {e}", file=sys.stderr)
         return None
     except Exception as e:
-        print(f"❌ Automation capture error: {e}", file=sys.stderr)
+        log(f"❌ Automation capture error: {e}", file=sys.stderr)
         return None
 
 
@@ -436,38 +494,70 @@ async def capture_bridge_automations(config_data: Dict, args) -> Dict[str, Dict]
 
     print(f"\n📊 Starting automation capture from {len(registered_bridges)} bridge(s)...\n")
 
-    results = {}
+    try:
+        from aiohttp import ClientSession, TCPConnector
+    except ImportError as e:
+        print(f"Error: Required library not found: {e}", file=sys.stderr)
+        return {}
+
+    # Ensure output directory exists (once, not per bridge)
+    if not args.json:
+        try:
+            Path(args.output).mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Error creating output directory {args.output}: {e}", file=sys.stderr)
 
-    for bridge in registered_bridges:
+    # Bridges are independent - capture them concurrently (bounded), prefixing
+    # progress lines with the bridge ID when more than one bridge is running
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BRIDGES)
+    loop = asyncio.get_running_loop()
+    prefix_bridge_id = len(registered_bridges) > 1
+
+    async def capture_one(bridge: Dict) -> Optional[Dict]:
         bridge_id = bridge['id']
         bridge_ip = bridge['ip']
         username = bridge.get('username')
         client_key = bridge.get('client_key')
-
-        print(f"Bridge: {bridge_id} ({bridge_ip})")
-
-        if not username:
-            print(f"   ⚠️  Skipping: No username found (not registered)")
-            continue
-
-        automations = await capture_automations(bridge_ip, username, client_key)
-
+        prefix = f"[{bridge_id}] " if prefix_bridge_id else ""
+
+        async with semaphore:
+            print(f"{prefix}Bridge: {bridge_id} ({bridge_ip})")
+
+            if not username:
+                print(f"{prefix}   ⚠️  Skipping: No username found (not registered)")
+                return None
+
+            automations = await capture_automations(bridge_ip, username, client_key,
+                                                    log_prefix=prefix, websession=session)
+
+            if automations:
+                # Save to file unless JSON mode
+                if not args.json:
+                    # Extract bridge name from automation data
+                    bridge_name = automations.get('bridge_info', {}).get('config', {}).get('name', bridge_id)
+
+                    # Serialize and write in a worker thread so other bridges keep
+                    # making progress (asyncio.to_thread needs Python 3.9+)
+                    output_file = await loop.run_in_executor(
+                        None, save_automations, automations, bridge_id, bridge_name, args.output
+                    )
+                    if output_file:
+                        print(f"{prefix}   💾 Saved automations to: {output_file}")
+                    else:
+                        print(f"{prefix}   ❌ Failed to save automations")
+
+            print()  # Empty line between bridges
+            return automations
+
+    # One connection pool for all bridges; HueBridgeV2 leaves a provided session open on close()
+    async with ClientSession(connector=TCPConnector(limit_per_host=MAX_CONNECTIONS_PER_BRIDGE)) as session:
+        captured = await asyncio.gather(*(capture_one(bridge) for bridge in registered_bridges))
+
+    # Keep config order in the results
+    results = {}
+    for bridge, automations in zip(registered_bridges, captured):
         if automations:
-            results[bridge_id] = automations
-
-            # Save to file unless JSON mode
-            if not args.json:
-                # Extract bridge name from automation data
-                bridge_name = automations.get('bridge_info', {}).get('config', {}).get('name', bridge_id)
-
-                if save_automations(automations, bridge_id, bridge_name, args.output):
-                    sanitized_name = sanitize_filename(bridge_name)
-                    output_file = Path(args.output) / f"{sanitized_name}-{bridge_id}-automations.json"
-                    print(f"   💾 Saved automations to: {output_file}")
-                else:
-                    print(f"   ❌ Failed to save automations")
-
-        print()  # Empty line between bridges
+            results[bridge['id']] = automations
 
     return results
 
@@ -500,8 +590,7 @@ def print_summary(results: Dict[str, Dict]):
 
         behavior_instances = automation_data.get('behavior_instances', {})
         if 'count' in behavior_instances:
-            enabled_count = sum(1 for item in behavior_instances.get('items', []) if item.get('enabled'))
-            print(f"   🤖 Behavior Instances: {behavior_instances['count']} ({enabled_count} enabled)")
+            print(f"   🤖 Behavior Instances: {behavior_instances['count']} ({behavior_instances.get('enabled_count', 0)} enabled)")
 
         behavior_scripts = automation_data.get('behavior_scripts', {})
         if 'count' in behavior_scripts:
@@ -542,7 +631,7 @@ def main():
     # Output results
     if args.json:
         # JSON mode - output to stdout
-        print(json.dumps(results, indent=2, cls=CustomJSONEncoder))
+        write_json_stdout(results)
     else:
         # Interactive mode - show summary
         print_summary(results)
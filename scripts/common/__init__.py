@@ -1,5 +1,8 @@
 """Common utilities for aiohue scripts."""
 
-from .json_utils import CustomJSONEncoder
+from .json_utils import (CustomJSONEncoder, dumps_json, loads_json, write_json_file,
+                         write_jsonl_file, write_json_stdout)
+from .model_utils import str_or_none
 
-__all__ = ['CustomJSONEncoder']
+__all__ = ['CustomJSONEncoder', 'dumps_json', 'loads_json', 'write_json_file',
+           'write_jsonl_file', 'write_json_stdout', 'str_or_none']
@@ -1,10 +1,53 @@
 """JSON utilities for aiohue scripts.
 
-This module provides custom JSON encoders for handling complex aiohue objects.
+This module provides custom JSON encoders for handling complex aiohue objects,
+plus dump/load helpers that use orjson when it is installed.
 """
 
+import dataclasses
 import json
+import sys
 from enum import Enum
+from json.encoder import (INFINITY, _make_iterencode, c_make_encoder,
+                          encode_basestring, encode_basestring_ascii)
+
+try:
+    import orjson  # Optional: faster JSON serialization/parsing
+except ImportError:
+    orjson = None
+
+
+# Attribute-name layout -> public (non '_') attribute names, filled on first sight.
+# Keyed by the layout rather than the class because plain objects may carry
+# different attribute sets per instance.
+_PUBLIC_FIELDS = {}
+
+
+def _public_fields(attrs: dict) -> tuple:
+    """Return the public attribute names of an instance __dict__ (cached per layout)."""
+    layout = tuple(attrs)
+    fields = _PUBLIC_FIELDS.get(layout)
+    if fields is None:
+        fields = tuple(k for k in layout if not k.startswith('_'))
+        _PUBLIC_FIELDS[layout] = fields
+    return fields
+
+
+# Class -> public dataclass field names (None for non-dataclass types).
+# Dataclass fields are fixed per class (aiohue v2 models are dataclasses).
+_DATACLASS_FIELDS = {}
+
+
+def _dataclass_fields(cls: type):
+    """Return the public field names of a dataclass type, or None for other types."""
+    try:
+        return _DATACLASS_FIELDS[cls]
+    except KeyError:
+        fields = None
+        if dataclasses.is_dataclass(cls):
+            fields = tuple(f.name for f in dataclasses.fields(cls) if not f.name.startswith('_'))
+        _DATACLASS_FIELDS[cls] = fields
+        return fields
 
 
 class CustomJSONEncoder(json.JSONEncoder):
@@ -12,17 +55,65 @@ class CustomJSONEncoder(json.JSONEncoder):
 
     This encoder handles:
     - Enum types (preserving original value type)
-    - Objects with __dict__ attributes (recursively serialized)
+    - Dataclasses (serialized as their public fields, names cached per class)
+    - Other objects with __dict__ attributes (serialized as their public attributes)
     - Circular references (detected and replaced with descriptive string)
     - Private attributes (starting with '_' are excluded)
 
+    default() returns a shallow dict and leaves the recursion to the encoder,
+    so it is only called again for nested objects. Circular references are
+    found via the encoder's own markers, i.e. the objects on the path
+    currently being encoded: a value that is already on that path (directly,
+    or as an item of a list or dict value) is replaced with the descriptive
+    string. An object referenced several times without a cycle (e.g. a shared
+    owner) is serialized in full each time.
+
     Usage:
         json.dumps(obj, cls=CustomJSONEncoder, indent=2)
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._visited = set()
+        self._active = {}
+
+    def iterencode(self, o, _one_shot=False):
+        """Encode the given object and yield each string representation as available.
+
+        Same as json.JSONEncoder.iterencode, except that the markers dict
+        (ids of the containers and objects on the path currently being
+        encoded) is always used and kept on the encoder for default().
+        """
+        markers = self._active = {}
+        _encoder = encode_basestring_ascii if self.ensure_ascii else encode_basestring
+
+        def floatstr(o, allow_nan=self.allow_nan,
+                     _repr=float.__repr__, _inf=INFINITY, _neginf=-INFINITY):
+            if o != o:
+                text = 'NaN'
+            elif o == _inf:
+                text = 'Infinity'
+            elif o == _neginf:
+                text = '-Infinity'
+            else:
+                return _repr(o)
+
+            if not allow_nan:
+                raise ValueError(
+                    "Out of range float values are not JSON compliant: " + repr(o))
+
+            return text
+
+        if _one_shot and c_make_encoder is not None and self.indent is None:
+            _iterencode = c_make_encoder(
+                markers, self.default, _encoder, self.indent,
+                self.key_separator, self.item_separator, self.sort_keys,
+                self.skipkeys, self.allow_nan)
+        else:
+            _iterencode = _make_iterencode(
+                markers, self.default, _encoder, self.indent, floatstr,
+                self.key_separator, self.item_separator, self.sort_keys,
+                self.skipkeys, _one_shot)
+        return _iterencode(o, 0)
 
     def default(self, obj):
         """Convert objects to JSON-serializable types.
@@ -37,35 +128,145 @@ class CustomJSONEncoder(json.JSONEncoder):
         if isinstance(obj, Enum):
             return obj.value if hasattr(obj, 'value') else str(obj)
 
-        # Handle objects with __dict__ (most aiohue objects)
-        if hasattr(obj, '__dict__'):
-            # Circular reference protection
-            obj_id = id(obj)
-            if obj_id in self._visited:
-                return f"<circular reference to {type(obj).__name__}>"
-
-            self._visited.add(obj_id)
-            try:
-                # Recursively convert nested objects
-                result = {}
-                for k, v in obj.__dict__.items():
-                    # Skip private attributes
-                    if k.startswith('_'):
-                        continue
-
-                    # Recursively handle nested objects
-                    if hasattr(v, '__dict__') and not isinstance(v, (str, int, float, bool, type(None))):
-                        result[k] = self.default(v)
-                    elif isinstance(v, list):
-                        result[k] = [self.default(item) if hasattr(item, '__dict__') else item for item in v]
-                    elif isinstance(v, dict):
-                        result[k] = {dk: (self.default(dv) if hasattr(dv, '__dict__') else dv) for dk, dv in v.items()}
-                    else:
-                        result[k] = v
-                return result
-            finally:
-                # Clean up visited set after processing
-                self._visited.discard(obj_id)
+        # Handle dataclasses (aiohue v2 models) and other objects with __dict__
+        fields = _dataclass_fields(type(obj))
+        if fields is not None or hasattr(obj, '__dict__'):
+            # Public attributes only; nested values are handled by the encoder
+            if fields is not None:
+                result = {k: getattr(obj, k) for k in fields}
+            else:
+                attrs = obj.__dict__
+                result = {k: attrs[k] for k in _public_fields(attrs)}
+
+            # Circular reference protection: the encoder has already marked obj
+            # and its ancestors, and would raise on reaching any of them again
+            active = self._active
+            if active:
+                for k, v in result.items():
+                    if id(v) in active:
+                        result[k] = _circular(v)
+                    elif type(v) is list:
+                        if any(id(item) in active for item in v):
+                            result[k] = [_circular(item) if id(item) in active else item for item in v]
+                    elif type(v) is dict:
+                        if any(id(dv) in active for dv in v.values()):
+                            result[k] = {dk: _circular(dv) if id(dv) in active else dv for dk, dv in v.items()}
+            return result
 
         # Last resort: convert to string
         return str(obj)
+
+
+def _circular(obj) -> str:
+    """Return the placeholder written instead of a circular reference."""
+    return f"<circular reference to {type(obj).__name__}>"
+
+
+def dumps_json(obj, indent: bool = True) -> bytes:
+    """Serialize an object to UTF-8 JSON.
+
+    Uses orjson when installed; dataclasses and datetimes are passed through
+    to CustomJSONEncoder.default so both backends produce the same document.
+    orjson cannot see the encoding path, so a circular reference runs into
+    its recursion limit; such documents (and anything else orjson rejects)
+    are encoded by CustomJSONEncoder instead, which replaces the cycles.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with a 2-space indent (False for a single line)
+
+    Returns:
+        bytes: JSON document (no trailing newline)
+    """
+    if orjson is not None:
+        option = (orjson.OPT_NON_STR_KEYS
+                  | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME)
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=CustomJSONEncoder().default, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None, cls=CustomJSONEncoder).encode('utf-8')
+
+
+def write_json_file(path, obj, indent: bool = True, stream: bool = False):
+    """Write an object to a JSON file.
+
+    The document is serialized to bytes first (one native call with orjson,
+    the encoder's one-shot path without it) and written with a single
+    write(), rather than json.dump issuing one write() per token.
+
+    With stream=True and no orjson, json.dump streams the encoder's chunks
+    to the file (through a 1 MiB buffer) instead, so the whole document is
+    never held in memory next to the object. Use it for potentially large
+    documents; orjson has no streaming API and always serializes in one call.
+
+    Args:
+        path: Output file path
+        obj: Object to serialize
+        indent: Pretty-print with a 2-space indent (False for a single line)
+        stream: Stream the document to the file when orjson is not installed
+    """
+    if stream and orjson is None:
+        with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            json.dump(obj, f, indent=2 if indent else None, cls=CustomJSONEncoder)
+        return
+
+    data = dumps_json(obj, indent)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def write_jsonl_file(path, items):
+    """Write items to a JSON Lines file (one compact JSON document per line).
+
+    Lets consumers process the items one at a time instead of parsing a
+    whole document first.
+
+    Args:
+        path: Output file path
+        items: Iterable of objects to serialize
+    """
+    with open(path, 'wb', buffering=1 << 20) as f:
+        for item in items:
+            f.write(dumps_json(item, indent=False))
+            f.write(b'\n')
+
+
+def write_json_stdout(obj, indent: bool = True):
+    """Write an object to stdout as JSON (with a trailing newline).
+
+    With orjson the encoded bytes go straight to the stdout buffer, skipping
+    the intermediate str and its re-encoding by print(). Without it, json.dump
+    streams the encoder's chunks to stdout.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with a 2-space indent (False for a single line)
+    """
+    if orjson is not None:
+        # Flush pending text output so it stays ahead of the buffered bytes
+        sys.stdout.flush()
+        sys.stdout.buffer.write(dumps_json(obj, indent) + b'\n')
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(obj, sys.stdout, indent=2 if indent else None, cls=CustomJSONEncoder)
+        sys.stdout.write('\n')
+
+
+def loads_json(data):
+    """Parse a JSON document (bytes or str), using orjson when installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    only need to catch the stdlib exception.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
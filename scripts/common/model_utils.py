@@ -0,0 +1,21 @@
+"""Model attribute helpers for aiohue scripts.
+
+This module provides small helpers for turning aiohue model attributes
+into plain JSON-friendly values.
+"""
+
+from typing import Optional
+
+
+def str_or_none(value) -> Optional[str]:
+    """Stringify an optional model attribute (ResourceTypes, ResourceIdentifier, ...).
+
+    Only None counts as unset; falsy values such as "" or 0 are stringified.
+
+    Args:
+        value: Attribute value, or None when unset
+
+    Returns:
+        str: String form of the value, or None when unset
+    """
+    return str(value) if value is not None else None
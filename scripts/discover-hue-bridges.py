@@ -33,22 +33,26 @@ Exit Codes:
 
 import sys
 import os
+import site
 from pathlib import Path
 
-# Auto-activate virtual environment
+# Auto-activate virtual environment (skipped when already running from it)
 VENV_PATH = Path(__file__).parent.parent.parent / "venv"
 VENV_ACTIVATE = VENV_PATH / "bin" / "activate_this.py"
 
-if VENV_PATH.exists():
-    # Add venv to sys.path
+if VENV_PATH.exists() and Path(sys.prefix).resolve() != VENV_PATH.resolve():
+    # Add venv to sys.path (first, as activation would) and process its .pth files
     venv_site_packages = VENV_PATH / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
     if venv_site_packages.exists():
         sys.path.insert(0, str(venv_site_packages))
+        site.addsitedir(str(venv_site_packages))
 
 import argparse
 import asyncio
 import json
 from datetime import datetime
+# Import shared JSON helpers (orjson when installed)
+from common.json_utils import write_json_file
 
 
 def parse_arguments():
@@ -99,9 +103,12 @@ async def discover_bridges():
         None: If discovery fails
     """
     try:
+        from aiohttp import ClientSession
         from aiohue.discovery import discover_nupnp
 
-        bridges = await discover_nupnp()
+        # One session for the N-UPnP query and the per-bridge v2 checks
+        async with ClientSession() as session:
+            bridges = await discover_nupnp(websession=session)
 
         if not bridges:
             return []
@@ -172,7 +179,8 @@ def print_json(bridges):
         'count': len(bridges) if bridges else 0,
         'bridges': bridges if bridges else []
     }
-    print(json.dumps(output, indent=2))
+    json.dump(output, sys.stdout, indent=2)
+    sys.stdout.write("\n")
 
 
 def save_bridges(bridges, filepath):
@@ -187,10 +195,11 @@ def save_bridges(bridges, filepath):
         bool: True if save successful, False otherwise
     """
     try:
-        # Create output structure with metadata
+        # Create output structure with metadata (one timestamp for both fields)
+        now = datetime.now()
         output = {
-            'discovered': datetime.now().strftime('%Y-%m-%d'),
-            'timestamp': datetime.now().isoformat(),
+            'discovered': now.strftime('%Y-%m-%d'),
+            'timestamp': now.isoformat(),
             'count': len(bridges) if bridges else 0,
             'bridges': []
         }
@@ -208,8 +217,7 @@ def save_bridges(bridges, filepath):
             output['bridges'].append(bridge_data)
 
         # Write to file
-        with open(filepath, 'w') as f:
-            json.dump(output, f, indent=2)
+        write_json_file(filepath, output)
 
         print(f"✓ Bridges saved to: {filepath}", file=sys.stderr)
         return True
@@ -22,9 +22,15 @@ Usage:
     # JSON output (machine-readable)
     python3 export-ha-hue-inventory.py --json
 
+    # Also write entities as JSON Lines (one entity per line)
+    python3 export-ha-hue-inventory.py --jsonl
+
     # Custom output directory
     python3 export-ha-hue-inventory.py --output-dir /path/to/output
 
+    # Reuse the entity/device registries from the last --cache run if unchanged
+    python3 export-ha-hue-inventory.py --cache
+
 Requirements:
     - SSH access to Home Assistant server
     - SSH key at relative path: ../../../homeassistant_ssh_key
@@ -32,7 +38,7 @@ Requirements:
     - Configure HA_SSH_HOST environment variable or edit SSH_HOST in script
 
 Output:
-    JSON files per bridge in ha_inventory/ directory:
+    Compact JSON files per bridge in ha_inventory/ directory (pretty-print with `jq .`):
     - ha_Bridge_Name-abc123def456.json
     - ha_Bridge_Name2-xyz789ghi012.json
 
@@ -43,27 +49,65 @@ Exit Codes:
 
 import sys
 import os
+import site
 from pathlib import Path
 
-# Auto-activate virtual environment
+# Auto-activate virtual environment (skipped when already running from it)
 VENV_PATH = Path(__file__).parent.parent.parent / "venv"
-if VENV_PATH.exists():
+if VENV_PATH.exists() and Path(sys.prefix).resolve() != VENV_PATH.resolve():
+    # Add venv to sys.path (first, as activation would) and process its .pth files
     venv_site_packages = VENV_PATH / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
     if venv_site_packages.exists():
         sys.path.insert(0, str(venv_site_packages))
+        site.addsitedir(str(venv_site_packages))
 
 import argparse
+import asyncio
+import io
 import json
 import re
-import subprocess
+import tarfile
+from collections import defaultdict
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+# Import shared JSON helpers (orjson when installed)
+from common.json_utils import loads_json, write_json_file, write_jsonl_file
 
 
 # SSH Configuration
 SSH_KEY = Path(__file__).parent.parent.parent / "homeassistant_ssh_key"
 SSH_USER = os.getenv("HA_SSH_USER", "hassio")
 
+# Share one authenticated SSH connection between commands (OpenSSH multiplexing).
+# A master is reused or started before the commands (see ssh_master); commands
+# connect directly if no master answers on the socket.
+SSH_MULTIPLEX_OPTIONS = ["-o", "ControlPath=~/.ssh/hue-ha-%C"]
+
+# How long to wait for a started master to accept connections, and how often to check
+SSH_MASTER_READY_TIMEOUT = 30
+SSH_MASTER_POLL_INTERVAL = 0.05
+
+# HA files read over SSH (relative to HA_CONFIG_DIR, fetched together as one tar stream)
+HA_CONFIG_DIR = "/homeassistant"
+HA_VERSION_FILE = ".HA_VERSION"
+CONFIG_ENTRIES_FILE = ".storage/core.config_entries"
+ENTITY_REGISTRY_FILE = ".storage/core.entity_registry"
+DEVICE_REGISTRY_FILE = ".storage/core.device_registry"
+
+# HA files that may be cached locally (--cache). core.config_entries holds the
+# credentials of every integration and is always fetched fresh, never cached.
+CACHEABLE_HA_FILES = (HA_VERSION_FILE, ENTITY_REGISTRY_FILE, DEVICE_REGISTRY_FILE)
+
+# Local cache of CACHEABLE_HA_FILES, reused while their size and mtime
+# (nanosecond resolution) on the HA server are unchanged
+HA_CACHE_DIR = Path.home() / ".cache" / "hue-inventory"
+
+# Precompiled patterns for host validation and filename sanitizing
+SSH_HOST_PATTERN = re.compile(r'^[\w\.\-\[\]:]+$')
+FILENAME_UNSAFE_CHARS = re.compile(r'[^\w\s-]')
+FILENAME_SEPARATOR_RUNS = re.compile(r'[-\s]+')
+
 
 def _load_ha_config() -> Dict[str, str]:
     """
@@ -76,14 +120,13 @@ def _load_ha_config() -> Dict[str, str]:
 
     if config_file.exists():
         try:
-            with open(config_file) as f:
-                config = json.load(f)
-                return {
-                    "ha_host": config.get("ha_host", ""),
-                    "ha_user": config.get("ha_user", "hassio"),
-                    "ha_ssh_key": config.get("ha_ssh_key", ""),
-                    "ha_inventory_dir": config.get("ha_inventory_dir", "/homeassistant/hue_inventories")
-                }
+            config = loads_json(config_file.read_bytes())
+            return {
+                "ha_host": config.get("ha_host", ""),
+                "ha_user": config.get("ha_user", "hassio"),
+                "ha_ssh_key": config.get("ha_ssh_key", ""),
+                "ha_inventory_dir": config.get("ha_inventory_dir", "/homeassistant/hue_inventories")
+            }
         except (json.JSONDecodeError, IOError):
             pass
 
@@ -114,7 +157,7 @@ def _validate_ssh_host(host: str) -> str:
         sys.exit(1)
 
     # Allow only safe characters: alphanumeric, underscore, dots, hyphens, brackets (IPv6), colons (IPv6/port)
-    if not re.match(r'^[\w\.\-\[\]:]+$', host):
+    if not SSH_HOST_PATTERN.match(host):
         print(f"Error: Invalid HA_SSH_HOST format: {host}", file=sys.stderr)
         print("Host must contain only alphanumeric characters, underscores, dots, hyphens, brackets, and colons", file=sys.stderr)
         sys.exit(1)
@@ -141,7 +184,9 @@ Examples:
   %(prog)s --bridge abc123def456              # Export by unique ID
   %(prog)s --include-states                   # Include current entity states
   %(prog)s --json                             # Machine-readable output
+  %(prog)s --jsonl                            # Also write entities as JSON Lines
   %(prog)s --output-dir /custom/path          # Custom output directory
+  %(prog)s --cache                            # Cache unchanged registries locally
 
 Environment Variables:
   HA_SSH_HOST                                 # Home Assistant IP/hostname
@@ -184,6 +229,19 @@ Comparison with aiohue Inventories:
         help="Output progress in JSON format (default: human-readable)"
     )
 
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Also write each bridge's entities as JSON Lines (<inventory>.entities.jsonl)"
+    )
+
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse the entity/device registries cached in {HA_CACHE_DIR} while unchanged "
+             "on the HA server (core.config_entries is always fetched, never cached)"
+    )
+
     parser.add_argument(
         "--version",
         action="version",
@@ -193,66 +251,278 @@ Comparison with aiohue Inventories:
     return parser.parse_args()
 
 
-def run_ssh_command(command: str) -> Optional[str]:
+async def _run_ssh_control(*options: str) -> bool:
     """
-    Execute command via SSH on Home Assistant.
+    Run an ssh control invocation (e.g. "-O check") with no command output.
 
     Args:
-        command: Command to execute
+        options: ssh options preceding the destination
 
     Returns:
-        Command output as string, or None on error
+        True if ssh exited successfully, False otherwise
     """
     try:
-        result = subprocess.run(
-            ["ssh", "-i", str(SSH_KEY), f"{SSH_USER}@{SSH_HOST}", command],
-            capture_output=True,
-            text=True,
-            timeout=30
+        proc = await asyncio.create_subprocess_exec(
+            "ssh", "-i", str(SSH_KEY), *SSH_MULTIPLEX_OPTIONS, *options, f"{SSH_USER}@{SSH_HOST}",
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
         )
+    except OSError:
+        return False
+
+    try:
+        return await asyncio.wait_for(proc.wait(), timeout=30) == 0
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return False
 
-        if result.returncode != 0:
-            print(f"SSH command failed: {result.stderr}", file=sys.stderr)
-            return None
 
-        return result.stdout
+async def _start_ssh_master() -> Optional[asyncio.subprocess.Process]:
+    """
+    Start a multiplexing SSH master as a child process and wait until it answers.
 
-    except subprocess.TimeoutExpired:
-        print("SSH command timed out", file=sys.stderr)
+    The master runs in the foreground (-N, no -f/ControlPersist), so it stays
+    a child of this process and never outlives it unnoticed. All standard
+    streams go to /dev/null, so no pipe waits on it. ControlMaster=auto
+    replaces a stale socket left by a crashed run instead of falling back to
+    a plain, non-multiplexed connection.
+
+    Returns:
+        The master process, or None if it could not be started
+    """
+    try:
+        master = await asyncio.create_subprocess_exec(
+            "ssh", "-i", str(SSH_KEY), *SSH_MULTIPLEX_OPTIONS, "-o", "ControlMaster=auto", "-N",
+            f"{SSH_USER}@{SSH_HOST}",
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+    except OSError:
         return None
-    except (subprocess.SubprocessError, OSError) as e:
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + SSH_MASTER_READY_TIMEOUT
+    while master.returncode is None and loop.time() < deadline:
+        if await _run_ssh_control("-O", "check"):
+            return master
+        await asyncio.sleep(SSH_MASTER_POLL_INTERVAL)
+
+    if master.returncode is None:
+        master.terminate()
+        await master.wait()
+    return None
+
+
+@asynccontextmanager
+async def ssh_master():
+    """
+    Keep a multiplexing SSH master open for the enclosed commands.
+
+    A master already answering on the control socket (e.g. from a concurrent
+    run) is reused and left running. Otherwise one is started as a child
+    process and terminated on the way out, so only a master this process
+    started is ever stopped. If none can be started, commands run via
+    run_ssh_command() simply connect on their own.
+    """
+    if await _run_ssh_control("-O", "check"):
+        yield
+        return
+
+    master = await _start_ssh_master()
+    try:
+        yield
+    finally:
+        if master is not None and master.returncode is None:
+            master.terminate()
+            await master.wait()
+
+
+async def run_ssh_command(command: str) -> Optional[bytes]:
+    """
+    Execute command via SSH on Home Assistant.
+
+    Args:
+        command: Command to execute
+
+    Returns:
+        Raw command output (callers decode or parse the bytes), or None on error
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ssh", "-i", str(SSH_KEY), *SSH_MULTIPLEX_OPTIONS, f"{SSH_USER}@{SSH_HOST}", command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except OSError as e:
         print(f"SSH error: {e}", file=sys.stderr)
         return None
 
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        print("SSH command timed out", file=sys.stderr)
+        return None
+
+    if proc.returncode != 0:
+        print(f"SSH command failed: {stderr.decode(errors='replace')}", file=sys.stderr)
+        return None
+
+    return stdout
+
+
+def _ha_files_cache_paths() -> Tuple[Path, Path]:
+    """Return (archive, file stats) cache file paths for the configured HA host."""
+    stem = f"ha_files-{sanitize_filename(SSH_HOST)}"
+    return HA_CACHE_DIR / f"{stem}.tar", HA_CACHE_DIR / f"{stem}.stat"
+
+
+def _read_ha_files_cache(file_stats: bytes) -> Optional[bytes]:
+    """
+    Read the cached HA files archive if it was fetched with the given file stats.
+
+    Args:
+        file_stats: Current `stat` output (name, size, mtime) for the cached files
+
+    Returns:
+        Cached tar archive, or None if missing or stale
+    """
+    archive_file, stats_file = _ha_files_cache_paths()
+    try:
+        if stats_file.read_bytes() == file_stats:
+            return archive_file.read_bytes()
+    except OSError:
+        pass
+    return None
+
+
+def _write_ha_files_cache(file_stats: bytes, archive: bytes) -> None:
+    """
+    Store a fetched HA files archive together with its file stats (best effort).
+
+    The registries are only readable by the current user; the mode is also
+    reset on files left by earlier runs.
+
+    Args:
+        file_stats: `stat` output for the cached files at fetch time
+        archive: Tar archive of CACHEABLE_HA_FILES
+    """
+    archive_file, stats_file = _ha_files_cache_paths()
+    try:
+        HA_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Archive first: a stale stats file only causes a refetch
+        for path, data in ((archive_file, archive), (stats_file, file_stats)):
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.fchmod(fd, 0o600)
+            with open(fd, 'wb') as f:
+                f.write(data)
+    except OSError as e:
+        print(f"Warning: Could not write HA files cache: {e}", file=sys.stderr)
+
+
+async def _fetch_ha_files_archive(names: Tuple[str, ...]) -> Optional[bytes]:
+    """
+    Fetch HA files as one tar archive with a single SSH call.
+
+    Args:
+        names: File names relative to HA_CONFIG_DIR
+
+    Returns:
+        Tar archive, or None on error
+    """
+    return await run_ssh_command(f"tar -C {HA_CONFIG_DIR} -cf - {' '.join(names)}")
+
+
+def _extract_ha_files(archive: bytes) -> Dict[str, bytes]:
+    """
+    Read the files of a tar archive fetched by _fetch_ha_files_archive().
+
+    Args:
+        archive: Tar archive
+
+    Returns:
+        Dict mapping file name (relative to HA_CONFIG_DIR) to its raw content;
+        empty on error
+    """
+    try:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            return {
+                member.name: tar.extractfile(member).read()
+                for member in tar.getmembers() if member.isfile()
+            }
+    except tarfile.TarError as e:
+        print(f"Failed to read HA files archive: {e}", file=sys.stderr)
+        return {}
+
+
+async def load_ha_files(use_cache: bool = False) -> Dict[str, bytes]:
+    """
+    Fetch the HA version file and storage registries.
+
+    The files are streamed as one tar archive instead of one `cat` per file.
+    With use_cache, the size and mtime of CACHEABLE_HA_FILES are checked
+    (alongside a fresh fetch of core.config_entries) and the archive from
+    the previous --cache run is reused while they are unchanged. A cache
+    miss costs one more SSH round-trip than a plain fetch.
+
+    Args:
+        use_cache: Reuse/update the local cache in HA_CACHE_DIR
+
+    Returns:
+        Dict mapping file name (relative to HA_CONFIG_DIR) to its raw content;
+        empty on error
+    """
+    if not use_cache:
+        archive = await _fetch_ha_files_archive(CACHEABLE_HA_FILES + (CONFIG_ENTRIES_FILE,))
+        return _extract_ha_files(archive) if archive else {}
+
+    stat_command = f"cd {HA_CONFIG_DIR} && stat -c '%n %s %y' {' '.join(CACHEABLE_HA_FILES)}"
+    file_stats, entries_archive = await asyncio.gather(
+        run_ssh_command(stat_command),
+        _fetch_ha_files_archive((CONFIG_ENTRIES_FILE,))
+    )
+
+    archive = _read_ha_files_cache(file_stats) if file_stats else None
+    if archive is None:
+        archive = await _fetch_ha_files_archive(CACHEABLE_HA_FILES)
+        if not archive:
+            return {}
+        if file_stats:
+            _write_ha_files_cache(file_stats, archive)
+
+    files = _extract_ha_files(archive)
+    if entries_archive:
+        files.update(_extract_ha_files(entries_archive))
+    return files
+
 
-def load_ha_storage_file(filepath: str) -> Optional[Dict]:
+def parse_ha_storage_file(files: Dict[str, bytes], name: str) -> Optional[Dict]:
     """
-    Load a JSON file from HA .storage directory.
+    Parse a JSON file from HA .storage directory.
 
     Args:
-        filepath: Path to file on HA server
+        files: File contents from load_ha_files()
+        name: File name relative to HA_CONFIG_DIR
 
     Returns:
         Parsed JSON dict, or None on error
     """
-    output = run_ssh_command(f"cat {filepath}")
-    if not output:
+    content = files.get(name)
+    if not content:
         return None
 
     try:
-        return json.loads(output)
+        return loads_json(content)
     except json.JSONDecodeError as e:
-        print(f"Failed to parse JSON from {filepath}: {e}", file=sys.stderr)
+        print(f"Failed to parse JSON from {HA_CONFIG_DIR}/{name}: {e}", file=sys.stderr)
         return None
 
 
-def get_ha_version() -> Optional[str]:
-    """Get Home Assistant version."""
-    output = run_ssh_command("cat /homeassistant/.HA_VERSION")
-    return output.strip() if output else None
-
-
-def get_api_states() -> Optional[List[Dict]]:
+async def get_api_states() -> Optional[List[Dict]]:
     """
     Query HA API for all entity states.
 
@@ -260,17 +530,48 @@ def get_api_states() -> Optional[List[Dict]]:
         List of entity state dicts, or None on error
     """
     command = 'curl -s -H "Authorization: Bearer $(cat /data/.ha_token)" http://localhost:8123/api/states'
-    output = run_ssh_command(command)
+    output = await run_ssh_command(command)
 
     if not output:
         return None
 
     try:
-        return json.loads(output)
+        return loads_json(output)
     except json.JSONDecodeError:
         return None
 
 
+async def load_ha_data(include_states: bool, use_cache: bool = False) -> tuple:
+    """
+    Fetch HA version, storage files and (optionally) API states concurrently.
+
+    The files come in one SSH round-trip and the API states in another, so
+    running them together makes the total wait roughly that of the slower one.
+
+    Args:
+        include_states: Whether to query the API for current states
+        use_cache: Reuse the local HA files cache (see load_ha_files)
+
+    Returns:
+        Tuple of (ha_version, config_entries, entity_registry, device_registry, api_states);
+        api_states is None when not requested
+    """
+    async with ssh_master():
+        if include_states:
+            files, api_states = await asyncio.gather(load_ha_files(use_cache), get_api_states())
+        else:
+            files, api_states = await load_ha_files(use_cache), None
+
+    version = files.get(HA_VERSION_FILE, b"").decode().strip() or None
+    return (
+        version,
+        parse_ha_storage_file(files, CONFIG_ENTRIES_FILE),
+        parse_ha_storage_file(files, ENTITY_REGISTRY_FILE),
+        parse_ha_storage_file(files, DEVICE_REGISTRY_FILE),
+        api_states
+    )
+
+
 def filter_hue_bridges(config_entries: Dict) -> List[Dict]:
     """
     Filter Hue bridge config entries.
@@ -287,52 +588,58 @@ def filter_hue_bridges(config_entries: Dict) -> List[Dict]:
     ]
 
 
-def filter_bridge_entities(entity_registry: Dict, config_entry_id: str) -> List[Dict]:
+def index_bridge_entities(entity_registry: Dict) -> Dict[str, List[Dict]]:
     """
-    Filter entities for specific bridge.
+    Group Hue entities by bridge.
 
     Args:
         entity_registry: Parsed core.entity_registry data
-        config_entry_id: Bridge config entry ID
 
     Returns:
-        List of entity dicts for this bridge
+        Dict with config entry ID as key, list of Hue entity dicts as value
     """
-    return [
-        entity for entity in entity_registry.get("data", {}).get("entities", [])
-        if entity.get("platform") == "hue"
-        and entity.get("config_entry_id") == config_entry_id
-    ]
+    entities_by_entry = defaultdict(list)
 
+    for entity in entity_registry.get("data", {}).get("entities", []):
+        if entity.get("platform") == "hue":
+            entities_by_entry[entity.get("config_entry_id")].append(entity)
 
-def get_device_info(device_registry: Dict, device_id: str) -> Optional[Dict]:
+    return entities_by_entry
+
+
+def index_devices(device_registry: Dict) -> Tuple[Dict[str, Dict], Dict[str, List[Dict]]]:
     """
-    Get device information from registry.
+    Index device registry entries for lookups during export.
 
     Args:
         device_registry: Parsed core.device_registry data
-        device_id: Device ID to look up
 
     Returns:
-        Device dict or None if not found
+        Tuple of (devices by device ID, devices by config entry ID)
     """
-    devices = device_registry.get("data", {}).get("devices", [])
-    return next((d for d in devices if d.get("id") == device_id), None)
+    devices_by_id = {}
+    devices_by_entry = defaultdict(list)
+
+    for device in device_registry.get("data", {}).get("devices", []):
+        devices_by_id[device.get("id")] = device
+        for entry_id in device.get("config_entries", []):
+            devices_by_entry[entry_id].append(device)
 
+    return devices_by_id, devices_by_entry
 
-def enrich_entity_with_state(entity: Dict, api_states: List[Dict]) -> Dict:
+
+def enrich_entity_with_state(entity: Dict, states_by_id: Dict[str, Dict]) -> Dict:
     """
     Add current state to entity from API.
 
     Args:
         entity: Entity dict from registry
-        api_states: List of all API states
+        states_by_id: All API states by entity ID
 
     Returns:
         Entity dict with added current_state field
     """
-    entity_id = entity.get("entity_id")
-    state = next((s for s in api_states if s.get("entity_id") == entity_id), None)
+    state = states_by_id.get(entity.get("entity_id"))
 
     if state:
         entity["current_state"] = {
@@ -343,32 +650,6 @@ def enrich_entity_with_state(entity: Dict, api_states: List[Dict]) -> Dict:
     return entity
 
 
-def group_entities_by_type(entities: List[Dict]) -> Dict[str, List[Dict]]:
-    """
-    Group entities by platform type.
-
-    Args:
-        entities: List of entity dicts
-
-    Returns:
-        Dict with entity_type as key, list of entities as value
-    """
-    grouped = {}
-
-    for entity in entities:
-        entity_id = entity.get("entity_id", "")
-
-        # Extract type from entity_id (light.xxx, sensor.xxx, etc.)
-        entity_type = entity_id.split(".")[0] if "." in entity_id else "unknown"
-
-        if entity_type not in grouped:
-            grouped[entity_type] = []
-
-        grouped[entity_type].append(entity)
-
-    return grouped
-
-
 def get_mac_address(device: Dict) -> Optional[str]:
     """Get first MAC address from device connections."""
     for conn in device.get("connections", []):
@@ -385,9 +666,10 @@ def get_all_mac_addresses(device: Dict) -> List[str]:
 def create_bridge_inventory(
     bridge: Dict,
     entities: List[Dict],
-    device_registry: Dict,
+    devices_by_id: Dict[str, Dict],
+    devices_by_entry: Dict[str, List[Dict]],
     include_states: bool,
-    api_states: Optional[List[Dict]],
+    states_by_id: Optional[Dict[str, Dict]],
     ha_version: str
 ) -> Dict:
     """
@@ -395,10 +677,11 @@ def create_bridge_inventory(
 
     Args:
         bridge: Bridge config entry
-        entities: List of entities for this bridge
-        device_registry: Device registry data
+        entities: List of entities for this bridge (enriched in place)
+        devices_by_id: Device registry entries by device ID (see index_devices)
+        devices_by_entry: Device registry entries by config entry ID
         include_states: Whether to include current states
-        api_states: API states (if include_states=True)
+        states_by_id: API states by entity ID (if include_states=True)
         ha_version: Home Assistant version
 
     Returns:
@@ -406,24 +689,21 @@ def create_bridge_inventory(
     """
     # Find bridge device
     bridge_device = None
-    devices = device_registry.get("data", {}).get("devices", [])
-    for device in devices:
-        if bridge["entry_id"] in device.get("config_entries", []):
-            identifiers = device.get("identifiers", [])
-            if identifiers and any(bridge["unique_id"] in str(ident) for ident in identifiers):
-                bridge_device = device
-                break
-
-    # Enrich entities with device info and optionally states
-    enriched_entities = []
+    for device in devices_by_entry.get(bridge["entry_id"], []):
+        identifiers = device.get("identifiers", [])
+        if identifiers and any(bridge["unique_id"] in str(ident) for ident in identifiers):
+            bridge_device = device
+            break
+
+    # Enrich entities in place (they are parsed from the registry for this export only)
+    # and group them by type in the same pass
+    grouped = defaultdict(list)
     for entity in entities:
-        enriched = entity.copy()
-
         # Add device info
         if entity.get("device_id"):
-            device = get_device_info(device_registry, entity["device_id"])
+            device = devices_by_id.get(entity["device_id"])
             if device:
-                enriched["device_info"] = {
+                entity["device_info"] = {
                     "manufacturer": device.get("manufacturer"),
                     "model": device.get("model"),
                     "model_id": device.get("model_id"),
@@ -432,13 +712,12 @@ def create_bridge_inventory(
                 }
 
         # Add current state if requested
-        if include_states and api_states:
-            enriched = enrich_entity_with_state(enriched, api_states)
+        if include_states and states_by_id:
+            enrich_entity_with_state(entity, states_by_id)
 
-        enriched_entities.append(enriched)
-
-    # Group by type
-    grouped = group_entities_by_type(enriched_entities)
+        # Extract type from entity_id (light.xxx, sensor.xxx, etc.)
+        entity_type, dot, _ = entity.get("entity_id", "").partition(".")
+        grouped[entity_type if dot else "unknown"].append(entity)
 
     # Create resources section
     resources = {}
@@ -449,6 +728,7 @@ def create_bridge_inventory(
         }
 
     # Build inventory
+    bridge_data = bridge.get("data", {})
     inventory = {
         "metadata": {
             "source": "home_assistant",
@@ -461,8 +741,8 @@ def create_bridge_inventory(
             "config_entry_id": bridge["entry_id"],
             "unique_id": bridge["unique_id"],
             "title": bridge["title"],
-            "host": bridge.get("data", {}).get("host"),
-            "api_version": bridge.get("data", {}).get("api_version"),
+            "host": bridge_data.get("host"),
+            "api_version": bridge_data.get("api_version"),
         },
         "resources": resources
     }
@@ -504,8 +784,8 @@ def sanitize_filename(name: str) -> str:
         'Test_Bridge'
     """
     # Replace problematic characters with safe alternatives
-    safe_name = re.sub(r'[^\w\s-]', '_', name)  # Keep alphanumeric, spaces, hyphens
-    safe_name = re.sub(r'[-\s]+', '_', safe_name)  # Collapse spaces/hyphens to single underscore
+    safe_name = FILENAME_UNSAFE_CHARS.sub('_', name)  # Keep alphanumeric, spaces, hyphens
+    safe_name = FILENAME_SEPARATOR_RUNS.sub('_', safe_name)  # Collapse spaces/hyphens to single underscore
     return safe_name.strip('_')  # Remove leading/trailing underscores
 
 
@@ -526,8 +806,16 @@ def main():
         print("=" * 70)
         print(f"\nConnecting to {SSH_HOST}...")
 
-    # Get HA version
-    ha_version = get_ha_version()
+    # Get HA version, storage files and (if requested) API states in parallel
+    if not args.json:
+        print("\nLoading HA storage files...")
+        if args.include_states:
+            print("Querying API for current states...")
+
+    ha_version, config_entries, entity_registry, device_registry, api_states = asyncio.run(
+        load_ha_data(args.include_states, use_cache=args.cache)
+    )
+
     if not ha_version:
         print("Error: Could not determine HA version", file=sys.stderr)
         sys.exit(1)
@@ -535,26 +823,15 @@ def main():
     if not args.json:
         print(f"Home Assistant Version: {ha_version}")
 
-    # Load storage files
-    if not args.json:
-        print("\nLoading HA storage files...")
-
-    config_entries = load_ha_storage_file("/homeassistant/.storage/core.config_entries")
-    entity_registry = load_ha_storage_file("/homeassistant/.storage/core.entity_registry")
-    device_registry = load_ha_storage_file("/homeassistant/.storage/core.device_registry")
-
     if not all([config_entries, entity_registry, device_registry]):
         print("Error: Failed to load required storage files", file=sys.stderr)
         sys.exit(1)
 
-    # Get API states if requested
-    api_states = None
-    if args.include_states:
-        if not args.json:
-            print("Querying API for current states...")
-        api_states = get_api_states()
-        if not api_states:
-            print("Warning: Could not load API states", file=sys.stderr)
+    if args.include_states and not api_states:
+        print("Warning: Could not load API states", file=sys.stderr)
+
+    # Index API states once for all bridges
+    states_by_id = {state.get("entity_id"): state for state in api_states} if api_states else None
 
     # Find Hue bridges
     bridges = filter_hue_bridges(config_entries)
@@ -565,9 +842,10 @@ def main():
 
     # Filter bridges if specific one requested
     if args.bridge:
+        needle = args.bridge.casefold()
         bridges = [
             b for b in bridges
-            if args.bridge.lower() in b.get("title", "").lower()
+            if needle in b.get("title", "").casefold()
             or args.bridge in b.get("unique_id", "")
         ]
 
@@ -579,6 +857,10 @@ def main():
         print(f"\nFound {len(bridges)} Hue bridge(s)")
         print()
 
+    # Index entities and devices once for all bridges
+    entities_by_entry = index_bridge_entities(entity_registry)
+    devices_by_id, devices_by_entry = index_devices(device_registry)
+
     # Export each bridge
     exported_files = []
 
@@ -590,7 +872,7 @@ def main():
             print(f"Processing: {bridge_title} ({bridge_id})...")
 
         # Get entities for this bridge
-        entities = filter_bridge_entities(entity_registry, bridge["entry_id"])
+        entities = entities_by_entry.get(bridge["entry_id"], [])
 
         if not args.json:
             print(f"  Found {len(entities)} entities")
@@ -599,9 +881,10 @@ def main():
         inventory = create_bridge_inventory(
             bridge,
             entities,
-            device_registry,
+            devices_by_id,
+            devices_by_entry,
             args.include_states,
-            api_states,
+            states_by_id,
             ha_version
         )
 
@@ -611,14 +894,25 @@ def main():
         filename = f"ha_{safe_title}-{safe_id or 'unknown_bridge'}.json"
         filepath = args.output_dir / filename
 
-        # Write file
-        with open(filepath, 'w') as f:
-            json.dump(inventory, f, indent=2, ensure_ascii=False)
+        # Write file (compact: machine-consumed, use `jq .` to pretty-print)
+        write_json_file(filepath, inventory, indent=False)
 
         exported_files.append(str(filepath))
 
         if not args.json:
             print(f"  Exported to: {filepath}")
+
+        # Optional JSON Lines sidecar: one entity per line for streaming consumers
+        if args.jsonl:
+            jsonl_path = filepath.with_suffix(".entities.jsonl")
+            write_jsonl_file(
+                jsonl_path,
+                (entity for group in inventory["resources"].values() for entity in group["items"])
+            )
+            if not args.json:
+                print(f"  Entities (JSONL): {jsonl_path}")
+
+        if not args.json:
             print()
 
     # Output results
@@ -628,7 +922,8 @@ def main():
             "bridges_exported": len(exported_files),
             "files": exported_files
         }
-        print(json.dumps(result, indent=2))
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write("\n")
     else:
         print("=" * 70)
         print(f"Successfully exported {len(exported_files)} bridge(s)")
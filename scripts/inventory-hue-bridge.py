@@ -21,6 +21,9 @@ Usage:
     # JSON output to stdout
     python3 inventory-hue-bridge.py --json
 
+    # Save pretty-printed (indented) inventory files instead of compact ones
+    python3 inventory-hue-bridge.py --pretty
+
     # Show help
     python3 inventory-hue-bridge.py --help
 
@@ -30,8 +33,9 @@ Requirements:
 
 Output:
     - Saves inventory for each bridge to bridges/inventory/{bridge-id}.json
+      (compact JSON; --pretty for indented output)
     - Interactive: Shows summary of resources found
-    - JSON mode: Outputs complete inventory to stdout
+    - JSON mode: Outputs complete inventory to stdout (indented)
 
 Exit Codes:
     0 - Success (inventory completed)
@@ -40,25 +44,30 @@ Exit Codes:
 
 import sys
 import os
+import site
 from pathlib import Path
 
-# Auto-activate virtual environment
+# Auto-activate virtual environment (skipped when already running from it)
 VENV_PATH = Path(__file__).parent.parent.parent / "venv"
 VENV_ACTIVATE = VENV_PATH / "bin" / "activate_this.py"
 
-if VENV_PATH.exists():
-    # Add venv to sys.path
+if VENV_PATH.exists() and Path(sys.prefix).resolve() != VENV_PATH.resolve():
+    # Add venv to sys.path (first, as activation would) and process its .pth files
     venv_site_packages = VENV_PATH / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
     if venv_site_packages.exists():
         sys.path.insert(0, str(venv_site_packages))
+        site.addsitedir(str(venv_site_packages))
 
 import argparse
 import asyncio
 import json
+import re
 from datetime import datetime
 from typing import Dict, List, Optional
-# Import shared JSON encoder
-from common.json_utils import CustomJSONEncoder
+# Import shared JSON helpers (enum handling, circular reference protection, orjson when installed)
+from common.json_utils import loads_json, write_json_file, write_json_stdout
+# Import shared model attribute helpers
+from common.model_utils import str_or_none
 
 # NOTE: CustomJSONEncoder class moved to common/json_utils.py to avoid duplication
 # The encoder provides: enum handling, circular reference protection, recursive serialization
@@ -68,6 +77,12 @@ from common.json_utils import CustomJSONEncoder
 DEFAULT_CONFIG_FILE = Path(__file__).parent.parent / "bridges" / "config.json"
 DEFAULT_INVENTORY_DIR = Path(__file__).parent.parent / "bridges" / "inventory"
 
+# Characters not allowed in output filenames (anything but alphanumeric, underscore, hyphen)
+FILENAME_INVALID_CHARS = re.compile(r'[^a-zA-Z0-9_-]')
+
+# Maximum number of bridges inventoried at the same time
+MAX_CONCURRENT_BRIDGES = 8
+
 
 def sanitize_filename(name: str) -> str:
     """
@@ -79,12 +94,127 @@ def sanitize_filename(name: str) -> str:
     Returns:
         str: Sanitized name suitable for filename
     """
-    import re
     # Replace spaces with underscores
     sanitized = name.replace(' ', '_')
     # Remove or replace special characters, keep only alphanumeric, underscore, hyphen
-    sanitized = re.sub(r'[^a-zA-Z0-9_-]', '', sanitized)
-    return sanitized
+    return FILENAME_INVALID_CHARS.sub('', sanitized)
+
+
+def _attrs_or_none(value) -> Optional[Dict]:
+    """
+    Return the attributes of an optional nested model object (metadata, dimming, ...).
+
+    Args:
+        value: Attribute value, or None when unset
+
+    Returns:
+        dict: Instance attributes of the value, or None when unset
+    """
+    if value is None:
+        return None
+    try:
+        return vars(value)
+    except TypeError:
+        # __slots__ classes have no __dict__
+        return {name: getattr(value, name, None) for name in getattr(type(value), '__slots__', ())}
+
+
+def _device_dict(device) -> Dict:
+    """
+    Build the inventory record for a device.
+
+    Args:
+        device: aiohue Device
+
+    Returns:
+        dict: Device record
+    """
+    return {
+        "id": device.id,
+        "type": str_or_none(getattr(device, 'type', None)),
+        "product_data": _attrs_or_none(getattr(device, 'product_data', None)),
+        "metadata": _attrs_or_none(getattr(device, 'metadata', None)),
+        "services": [str(s) for s in getattr(device, 'services', None) or ()]
+    }
+
+
+def _light_dict(light) -> Dict:
+    """
+    Build the inventory record for a light.
+
+    Args:
+        light: aiohue Light
+
+    Returns:
+        dict: Light record
+    """
+    return {
+        "id": light.id,
+        "type": str_or_none(getattr(light, 'type', None)),
+        "on": _attrs_or_none(getattr(light, 'on', None)),
+        "dimming": _attrs_or_none(getattr(light, 'dimming', None)),
+        "color": _attrs_or_none(getattr(light, 'color', None)),
+        "color_temperature": _attrs_or_none(getattr(light, 'color_temperature', None)),
+        "metadata": _attrs_or_none(getattr(light, 'metadata', None)),
+        "owner": str_or_none(getattr(light, 'owner', None))
+    }
+
+
+def _scene_dict(scene) -> Dict:
+    """
+    Build the inventory record for a scene.
+
+    Args:
+        scene: aiohue Scene
+
+    Returns:
+        dict: Scene record (actions are left to the JSON encoder)
+    """
+    actions = getattr(scene, 'actions', None)
+    return {
+        "id": scene.id,
+        "type": str_or_none(getattr(scene, 'type', None)),
+        "metadata": _attrs_or_none(getattr(scene, 'metadata', None)),
+        "group": str_or_none(getattr(scene, 'group', None)),
+        "actions": actions if actions is not None else []
+    }
+
+
+def _group_dict(group) -> Dict:
+    """
+    Build the inventory record for a zone or room.
+
+    Args:
+        group: aiohue Zone or Room
+
+    Returns:
+        dict: Group record
+    """
+    return {
+        "id": group.id,
+        "type": str_or_none(getattr(group, 'type', None)),
+        "metadata": _attrs_or_none(getattr(group, 'metadata', None)),
+        "children": [str(c) for c in getattr(group, 'children', None) or ()]
+    }
+
+
+def _sensor_dict(sensor) -> Dict:
+    """
+    Build the inventory record for a sensor.
+
+    Args:
+        sensor: aiohue sensor resource
+
+    Returns:
+        dict: Sensor record
+    """
+    return {
+        "id": sensor.id,
+        "type": str_or_none(getattr(sensor, 'type', None)),
+        "enabled": getattr(sensor, 'enabled', None),
+        "metadata": _attrs_or_none(getattr(sensor, 'metadata', None)),
+        "owner": str_or_none(getattr(sensor, 'owner', None))
+    }
 
 
 def parse_arguments():
@@ -99,11 +229,14 @@ Examples:
   %(prog)s --config /path/to/config.json          # Use custom config file
   %(prog)s --output /path/to/inventory            # Custom output directory
   %(prog)s --json                                 # JSON output to stdout
+  %(prog)s --pretty                               # Indented inventory files
 
 Notes:
   - Only registered bridges will be inventoried
   - Inventory files are saved as {bridge-id}.json
   - Use --json for machine-readable output
+  - Inventory files are compact JSON by default; use --pretty or `jq .` to read them
+  - JSON written to stdout (--json) is always indented
 
 For more information, visit: https://github.com/home-assistant-libs/aiohue
         """
@@ -138,6 +271,12 @@ For more information, visit: https://github.com/home-assistant-libs/aiohue
         help="Output inventory in JSON format to stdout (does not save to files)"
     )
 
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Pretty-print inventory files with indentation (default: compact; stdout is always indented)"
+    )
+
     parser.add_argument(
         "--version",
         action="version",
@@ -158,9 +297,8 @@ def load_config(filepath: str) -> Optional[Dict]:
         dict: Bridge configuration data, or None on error
     """
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        return data
+        # Single read + parse (orjson when installed; it raises a json.JSONDecodeError subclass)
+        return loads_json(Path(filepath).read_bytes())
     except FileNotFoundError:
         print(f"Error: Config file not found: {filepath}", file=sys.stderr)
         print("Run discover-hue-bridges.py first to create it.", file=sys.stderr)
@@ -173,59 +311,65 @@ def load_config(filepath: str) -> Optional[Dict]:
         return None
 
 
-def save_inventory(inventory: Dict, bridge_id: str, bridge_name: str, output_dir: str) -> bool:
+def save_inventory(inventory: Dict, bridge_id: str, bridge_name: str, output_dir: str,
+                   pretty: bool = False) -> Optional[Path]:
     """
     Save bridge inventory to JSON file.
 
+    The output directory must already exist (inventory_bridges creates it once).
+
     Args:
         inventory (dict): Inventory data
         bridge_id (str): Bridge ID
         bridge_name (str): Bridge name
         output_dir (str): Output directory path
+        pretty (bool): Indent the JSON (default: compact)
 
     Returns:
-        bool: True if successful, False otherwise
+        Path: Written file if successful, None otherwise
     """
     try:
-        # Ensure output directory exists
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
-
         # Use format: {name}-{bridge_id}.json
         sanitized_name = sanitize_filename(bridge_name)
         output_file = Path(output_dir) / f"{sanitized_name}-{bridge_id}.json"
-        with open(output_file, 'w') as f:
-            json.dump(inventory, f, indent=2, cls=CustomJSONEncoder)
+        # Serialized once, written with a single write() (not one per JSON token)
+        write_json_file(output_file, inventory, indent=pretty)
 
-        return True
+        return output_file
     except Exception as e:
         print(f"Error saving inventory: {e}", file=sys.stderr)
-        return False
+        return None
 
 
-async def inventory_bridge(bridge_ip: str, username: str, client_key: Optional[str] = None) -> Optional[Dict]:
+async def inventory_bridge(bridge_class, bridge_ip: str, username: str,
+                           client_key: Optional[str] = None,
+                           log_prefix: str = "") -> Optional[Dict]:
     """
     Connect to a Hue bridge and retrieve comprehensive inventory.
 
     Args:
+        bridge_class: aiohue HueBridgeV2 class (imported once by the caller)
         bridge_ip (str): IP address of the bridge
         username (str): API username
         client_key (str, optional): Client key for V2 API
+        log_prefix (str, optional): Prefix for progress lines (keeps concurrent bridges apart)
 
     Returns:
         dict: Complete inventory of bridge resources, or None on error
     """
-    try:
-        from aiohue.v2 import HueBridgeV2
+    def log(message: str = "", **kwargs):
+        print(f"{log_prefix}{message}", **kwargs)
 
-        print(f"   🔄 Connecting to bridge at {bridge_ip}...")
+    try:
+        log(f"   🔄 Connecting to bridge at {bridge_ip}...")
 
-        bridge = HueBridgeV2(bridge_ip, username)
+        bridge = bridge_class(bridge_ip, username)
 
         try:
             await bridge.initialize()
-            print(f"   ✅ Connected successfully")
+            log(f"   ✅ Connected successfully")
         except Exception as e:
-            print(f"   ❌ Failed to initialize bridge: {e}", file=sys.stderr)
+            log(f"   ❌ Failed to initialize bridge: {e}", file=sys.stderr)
             await bridge.close()
             return None
 
@@ -239,76 +383,46 @@ async def inventory_bridge(bridge_ip: str, username: str, client_key: Optional[s
 
         # Retrieve devices
         try:
-            print(f"      📱 Retrieving devices...")
+            log(f"      📱 Retrieving devices...")
             devices = bridge.devices.items
             inventory["resources"]["devices"] = {
                 "count": len(devices),
-                "items": [
-                    {
-                        "id": device.id,
-                        "type": str(device.type) if hasattr(device, 'type') else None,
-                        "product_data": device.product_data.__dict__ if hasattr(device, 'product_data') else None,
-                        "metadata": device.metadata.__dict__ if hasattr(device, 'metadata') else None,
-                        "services": [str(s) for s in device.services] if hasattr(device, 'services') else []
-                    }
-                    for device in devices
-                ]
+                "items": [_device_dict(device) for device in devices]
             }
-            print(f"      ✅ Found {len(devices)} devices")
+            log(f"      ✅ Found {len(devices)} devices")
         except Exception as e:
-            print(f"      ⚠️  Error retrieving devices: {e}", file=sys.stderr)
+            log(f"      ⚠️  Error retrieving devices: {e}", file=sys.stderr)
             inventory["resources"]["devices"] = {"error": str(e)}
 
         # Retrieve lights
         try:
-            print(f"      💡 Retrieving lights...")
+            log(f"      💡 Retrieving lights...")
             lights = bridge.lights.items
             inventory["resources"]["lights"] = {
                 "count": len(lights),
-                "items": [
-                    {
-                        "id": light.id,
-                        "type": str(light.type) if hasattr(light, 'type') else None,
-                        "on": light.on.__dict__ if hasattr(light, 'on') and light.on is not None else None,
-                        "dimming": light.dimming.__dict__ if hasattr(light, 'dimming') and light.dimming is not None else None,
-                        "color": light.color.__dict__ if hasattr(light, 'color') and light.color is not None else None,
-                        "color_temperature": light.color_temperature.__dict__ if hasattr(light, 'color_temperature') and light.color_temperature is not None else None,
-                        "metadata": light.metadata.__dict__ if hasattr(light, 'metadata') and light.metadata is not None else None,
-                        "owner": str(light.owner) if hasattr(light, 'owner') and light.owner is not None else None
-                    }
-                    for light in lights
-                ]
+                "items": [_light_dict(light) for light in lights]
             }
-            print(f"      ✅ Found {len(lights)} lights")
+            log(f"      ✅ Found {len(lights)} lights")
         except Exception as e:
-            print(f"      ⚠️  Error retrieving lights: {e}", file=sys.stderr)
+            log(f"      ⚠️  Error retrieving lights: {e}", file=sys.stderr)
             inventory["resources"]["lights"] = {"error": str(e)}
 
         # Retrieve scenes
         try:
-            print(f"      🎨 Retrieving scenes...")
+            log(f"      🎨 Retrieving scenes...")
             scenes = bridge.scenes.items
             inventory["resources"]["scenes"] = {
                 "count": len(scenes),
-                "items": [
-                    {
-                        "id": scene.id,
-                        "type": str(scene.type) if hasattr(scene, 'type') else None,
-                        "metadata": scene.metadata.__dict__ if hasattr(scene, 'metadata') and scene.metadata is not None else None,
-                        "group": str(scene.group) if hasattr(scene, 'group') and scene.group is not None else None,
-                        "actions": scene.actions if hasattr(scene, 'actions') and scene.actions is not None else []
-                    }
-                    for scene in scenes
-                ]
+                "items": [_scene_dict(scene) for scene in scenes]
             }
-            print(f"      ✅ Found {len(scenes)} scenes")
+            log(f"      ✅ Found {len(scenes)} scenes")
         except Exception as e:
-            print(f"      ⚠️  Error retrieving scenes: {e}", file=sys.stderr)
+            log(f"      ⚠️  Error retrieving scenes: {e}", file=sys.stderr)
             inventory["resources"]["scenes"] = {"error": str(e)}
 
         # Retrieve groups (zones, rooms)
         try:
-            print(f"      🏠 Retrieving groups (zones/rooms)...")
+            log(f"      🏠 Retrieving groups (zones/rooms)...")
             groups = bridge.groups.items
 
             zones = [g for g in groups if g.type == "zone"]
@@ -318,69 +432,44 @@ async def inventory_bridge(bridge_ip: str, username: str, client_key: Optional[s
                 "total_count": len(groups),
                 "zones": {
                     "count": len(zones),
-                    "items": [
-                        {
-                            "id": zone.id,
-                            "type": str(zone.type) if hasattr(zone, 'type') else None,
-                            "metadata": zone.metadata.__dict__ if hasattr(zone, 'metadata') and zone.metadata is not None else None,
-                            "children": [str(c) for c in zone.children] if hasattr(zone, 'children') and zone.children is not None else []
-                        }
-                        for zone in zones
-                    ]
+                    "items": [_group_dict(zone) for zone in zones]
                 },
                 "rooms": {
                     "count": len(rooms),
-                    "items": [
-                        {
-                            "id": room.id,
-                            "type": str(room.type) if hasattr(room, 'type') else None,
-                            "metadata": room.metadata.__dict__ if hasattr(room, 'metadata') and room.metadata is not None else None,
-                            "children": [str(c) for c in room.children] if hasattr(room, 'children') and room.children is not None else []
-                        }
-                        for room in rooms
-                    ]
+                    "items": [_group_dict(room) for room in rooms]
                 }
             }
-            print(f"      ✅ Found {len(zones)} zones, {len(rooms)} rooms")
+            log(f"      ✅ Found {len(zones)} zones, {len(rooms)} rooms")
         except Exception as e:
-            print(f"      ⚠️  Error retrieving groups: {e}", file=sys.stderr)
+            log(f"      ⚠️  Error retrieving groups: {e}", file=sys.stderr)
             inventory["resources"]["groups"] = {"error": str(e)}
 
         # Retrieve sensors
         try:
-            print(f"      🌡️  Retrieving sensors...")
+            log(f"      🌡️  Retrieving sensors...")
             sensors = bridge.sensors.items
             inventory["resources"]["sensors"] = {
                 "count": len(sensors),
-                "items": [
-                    {
-                        "id": sensor.id,
-                        "type": str(sensor.type) if hasattr(sensor, 'type') else None,
-                        "enabled": sensor.enabled if hasattr(sensor, 'enabled') else None,
-                        "metadata": sensor.metadata.__dict__ if hasattr(sensor, 'metadata') and sensor.metadata is not None else None,
-                        "owner": str(sensor.owner) if hasattr(sensor, 'owner') and sensor.owner is not None else None
-                    }
-                    for sensor in sensors
-                ]
+                "items": [_sensor_dict(sensor) for sensor in sensors]
             }
-            print(f"      ✅ Found {len(sensors)} sensors")
+            log(f"      ✅ Found {len(sensors)} sensors")
         except Exception as e:
-            print(f"      ⚠️  Error retrieving sensors: {e}", file=sys.stderr)
+            log(f"      ⚠️  Error retrieving sensors: {e}", file=sys.stderr)
             inventory["resources"]["sensors"] = {"error": str(e)}
 
         # Get bridge config/info
         try:
-            print(f"      ⚙️  Retrieving bridge configuration...")
+            log(f"      ⚙️  Retrieving bridge configuration...")
             config = bridge.config
             inventory["bridge_info"]["config"] = {
-                "bridge_id": config.bridge_id if hasattr(config, 'bridge_id') else None,
-                "name": config.name if hasattr(config, 'name') else None,
-                "model_id": config.model_id if hasattr(config, 'model_id') else None,
-                "sw_version": config.sw_version if hasattr(config, 'sw_version') else None,
+                "bridge_id": getattr(config, 'bridge_id', None),
+                "name": getattr(config, 'name', None),
+                "model_id": getattr(config, 'model_id', None),
+                "sw_version": getattr(config, 'sw_version', None),
             }
-            print(f"      ✅ Retrieved bridge configuration")
+            log(f"      ✅ Retrieved bridge configuration")
         except Exception as e:
-            print(f"      ⚠️  Error retrieving config: {e}", file=sys.stderr)
+            log(f"      ⚠️  Error retrieving config: {e}", file=sys.stderr)
             inventory["bridge_info"]["config"] = {"error": str(e)}
 
         # Close bridge connection
@@ -388,11 +477,8 @@ async def inventory_bridge(bridge_ip: str, username: str, client_key: Optional[s
 
         return inventory
 
-    except ImportError as e:
-        print(f"Error: Required library not found: {e}", file=sys.stderr)
-        return None
     except Exception as e:
-        print(f"❌ Inventory error: {e}", file=sys.stderr)
+        log(f"❌ Inventory error: {e}", file=sys.stderr)
         return None
 
 
@@ -427,40 +513,72 @@ async def inventory_bridges(config_data: Dict, args) -> Dict[str, Dict]:
             print(f"Bridge ID '{args.bridge_id}' not found or not registered.", file=sys.stderr)
             return {}
 
+    # Import aiohue here (once for all bridges) rather than at module level,
+    # so --help/--version do not load aiohue/aiohttp
+    try:
+        from aiohue.v2 import HueBridgeV2
+    except ImportError as e:
+        print(f"Error: Required library not found: {e}", file=sys.stderr)
+        return {}
+
     print(f"\n📊 Starting inventory of {len(registered_bridges)} bridge(s)...\n")
 
-    results = {}
+    # Ensure output directory exists (once, not per bridge)
+    if not args.json:
+        try:
+            Path(args.output).mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Error creating output directory {args.output}: {e}", file=sys.stderr)
+
+    # Bridges are independent - inventory them concurrently (bounded), prefixing
+    # progress lines with the bridge ID when more than one bridge is running
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BRIDGES)
+    loop = asyncio.get_running_loop()
+    prefix_bridge_id = len(registered_bridges) > 1
 
-    for bridge in registered_bridges:
+    async def inventory_one(bridge: Dict) -> Optional[Dict]:
         bridge_id = bridge['id']
         bridge_ip = bridge['ip']
         username = bridge.get('username')
         client_key = bridge.get('client_key')
+        prefix = f"[{bridge_id}] " if prefix_bridge_id else ""
 
-        print(f"Bridge: {bridge_id} ({bridge_ip})")
+        async with semaphore:
+            print(f"{prefix}Bridge: {bridge_id} ({bridge_ip})")
 
-        if not username:
-            print(f"   ⚠️  Skipping: No username found (not registered)")
-            continue
+            if not username:
+                print(f"{prefix}   ⚠️  Skipping: No username found (not registered)")
+                return None
 
-        inventory = await inventory_bridge(bridge_ip, username, client_key)
+            inventory = await inventory_bridge(HueBridgeV2, bridge_ip, username, client_key,
+                                               log_prefix=prefix)
 
-        if inventory:
-            results[bridge_id] = inventory
+            if inventory:
+                # Save to file unless JSON mode
+                if not args.json:
+                    # Extract bridge name from inventory
+                    bridge_name = inventory.get('bridge_info', {}).get('config', {}).get('name', bridge_id)
+
+                    # Serialize and write in a worker thread so other bridges keep
+                    # making progress (asyncio.to_thread needs Python 3.9+)
+                    output_file = await loop.run_in_executor(
+                        None, save_inventory, inventory, bridge_id, bridge_name, args.output, args.pretty
+                    )
+                    if output_file:
+                        print(f"{prefix}   💾 Saved inventory to: {output_file}")
+                    else:
+                        print(f"{prefix}   ❌ Failed to save inventory")
 
-            # Save to file unless JSON mode
-            if not args.json:
-                # Extract bridge name from inventory
-                bridge_name = inventory.get('bridge_info', {}).get('config', {}).get('name', bridge_id)
+            print()  # Empty line between bridges
+            return inventory
 
-                if save_inventory(inventory, bridge_id, bridge_name, args.output):
-                    sanitized_name = sanitize_filename(bridge_name)
-                    output_file = Path(args.output) / f"{sanitized_name}-{bridge_id}.json"
-                    print(f"   💾 Saved inventory to: {output_file}")
-                else:
-                    print(f"   ❌ Failed to save inventory")
+    inventories = await asyncio.gather(*(inventory_one(bridge) for bridge in registered_bridges))
 
-        print()  # Empty line between bridges
+    # Keep config order in the results
+    results = {}
+    for bridge, inventory in zip(registered_bridges, inventories):
+        if inventory:
+            results[bridge['id']] = inventory
 
     return results
 
@@ -533,7 +651,7 @@ def main():
     # Output results
     if args.json:
         # JSON mode - output to stdout
-        print(json.dumps(results, indent=2, cls=CustomJSONEncoder))
+        write_json_stdout(results)
     else:
         # Interactive mode - show summary
         print_summary(results)
@@ -0,0 +1,97 @@
+"""Tests for the SSH master handling in export-ha-hue-inventory.py."""
+
+import asyncio
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "export-ha-hue-inventory.py"
+
+# Stand-in for ssh: "-N" runs a master that holds a pid file (the control
+# socket) until terminated, "-O check" succeeds while that master is alive
+FAKE_SSH = """#!{python}
+import os, signal, sys, time
+state = os.environ["FAKE_SSH_STATE"]
+with open(os.path.join(state, "calls"), "a") as f:
+    f.write(" ".join(sys.argv[1:]) + "\\n")
+socket = os.path.join(state, "socket")
+if "-O" in sys.argv:
+    try:
+        os.kill(int(open(socket).read()), 0)
+    except (OSError, ValueError):
+        sys.exit(255)
+    sys.exit(0)
+if "-N" in sys.argv:
+    def stop(*_):
+        os.unlink(socket)
+        sys.exit(0)
+    signal.signal(signal.SIGTERM, stop)
+    with open(socket, "w") as f:
+        f.write(str(os.getpid()))
+    while True:
+        time.sleep(1)
+"""
+
+
+@pytest.fixture
+def export(tmp_path, monkeypatch):
+    """Load the export script with a fake ssh first on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    ssh = bin_dir / "ssh"
+    ssh.write_text(FAKE_SSH.format(python=sys.executable))
+    ssh.chmod(0o755)
+
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_SSH_STATE", str(tmp_path))
+    monkeypatch.setenv("HA_SSH_HOST", "ha.local")
+    monkeypatch.syspath_prepend(str(SCRIPT.parent))
+
+    spec = importlib.util.spec_from_file_location("export_ha_hue_inventory", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.SSH_MASTER_POLL_INTERVAL = 0.01
+    return module
+
+
+def _calls(tmp_path):
+    return (tmp_path / "calls").read_text().splitlines()
+
+
+def _run_in_master(export):
+    async def run():
+        async with export.ssh_master():
+            return await export._run_ssh_control("-O", "check")
+
+    return asyncio.run(run())
+
+
+def test_existing_master_is_reused_and_left_running(export, tmp_path):
+    socket = tmp_path / "socket"
+    other = subprocess.Popen([str(tmp_path / "bin" / "ssh"), "-N", "other-run"])
+    try:
+        for _ in range(200):
+            if socket.exists():
+                break
+            time.sleep(0.01)
+
+        assert _run_in_master(export)
+
+        assert not [call for call in _calls(tmp_path) if "-N" in call and "other-run" not in call]
+        assert other.poll() is None
+        assert socket.read_text() == str(other.pid)
+    finally:
+        other.terminate()
+        other.wait()
+
+
+def test_master_is_started_and_stopped(export, tmp_path):
+    assert _run_in_master(export)
+
+    assert len([call for call in _calls(tmp_path) if "-N" in call]) == 1
+    assert not (tmp_path / "socket").exists()
@@ -0,0 +1,103 @@
+"""Tests for the shared JSON helpers in scripts/common."""
+
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common import json_utils  # noqa: E402
+from common.json_utils import CustomJSONEncoder, dumps_json  # noqa: E402
+
+
+@dataclass
+class ResourceIdentifier:
+    rid: str
+
+
+@dataclass
+class Action:
+    owner: ResourceIdentifier
+    targets: List[ResourceIdentifier]
+
+
+class Node:
+    def __init__(self, name: str, parent: Any = None):
+        self.name = name
+        self.parent = parent
+        self._private = "hidden"
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with and without orjson."""
+    if request.param == "orjson":
+        if json_utils.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    return request.param
+
+
+def test_shared_dataclass_is_serialized_each_time(backend):
+    shared = ResourceIdentifier("a")
+    action = Action(owner=shared, targets=[shared, shared])
+
+    result = json.loads(dumps_json({"owner": shared, "action": action}))
+
+    assert result == {
+        "owner": {"rid": "a"},
+        "action": {"owner": {"rid": "a"}, "targets": [{"rid": "a"}, {"rid": "a"}]},
+    }
+
+
+def test_circular_reference_is_replaced(backend):
+    root = Node("root")
+    child = Node("child", parent=root)
+    root.parent = child
+
+    result = json.loads(dumps_json(root))
+
+    assert result == {
+        "name": "root",
+        "parent": {"name": "child", "parent": "<circular reference to Node>"},
+    }
+
+
+def test_circular_reference_in_list_is_replaced(backend):
+    root = Node("root")
+    root.children = [Node("child", parent=root), root]
+
+    result = json.loads(dumps_json([root, root]))
+
+    expected = {
+        "name": "root",
+        "parent": None,
+        "children": [
+            {"name": "child", "parent": "<circular reference to Node>"},
+            "<circular reference to Node>",
+        ],
+    }
+    assert result == [expected, expected]
+
+
+def test_encoder_class_with_json_dumps():
+    shared = ResourceIdentifier("a")
+
+    result = json.loads(json.dumps({"x": shared, "y": shared}, cls=CustomJSONEncoder))
+
+    assert result == {"x": {"rid": "a"}, "y": {"rid": "a"}}
+
+
+def test_streamed_file_matches_single_write(backend, tmp_path):
+    shared = ResourceIdentifier("a")
+    data = {"owner": shared, "targets": [shared, shared]}
+
+    json_utils.write_json_file(tmp_path / "single.json", data)
+    json_utils.write_json_file(tmp_path / "streamed.json", data, stream=True)
+
+    assert (tmp_path / "streamed.json").read_bytes() == (tmp_path / "single.json").read_bytes()